@@ -1,13 +1,14 @@
 """Base class for agents that use versioned prompt specifications."""
 
 import logging
+import os
 import re
 from pathlib import Path
 
 import yaml
 
 from weft.ai.backend import AIBackend
-from weft.queue.models import PromptTask
+from weft.queue.models import PromptTask, split_frontmatter
 from weft.watchers.base import BaseWatcher
 
 logger = logging.getLogger(__name__)
@@ -184,16 +185,12 @@ class BaseSpecAgent(BaseWatcher):
             try:
                 content = prompt_file.read_text(encoding="utf-8")
                 # Parse frontmatter to get conversation_id
-                if "---" not in content:
+                split = split_frontmatter(content)
+                if split is None:
                     continue
 
-                parts = content.split("---", 2)
-                if len(parts) < 3:
-                    continue
-
-                import yaml
-
-                frontmatter = yaml.safe_load(parts[1])
+                frontmatter_text, body = split
+                frontmatter = yaml.safe_load(frontmatter_text)
                 if not isinstance(frontmatter, dict):
                     continue
 
@@ -202,7 +199,7 @@ class BaseSpecAgent(BaseWatcher):
                     continue
 
                 # Extract prompt text
-                prompt_text = parts[2].strip()
+                prompt_text = body.strip()
 
                 # Get timestamp from filename or file creation time
                 timestamp = prompt_file.stat().st_ctime
@@ -213,12 +210,9 @@ class BaseSpecAgent(BaseWatcher):
                 if result_file:
                     result_content = result_file.read_text(encoding="utf-8")
                     # Extract result text (after frontmatter)
-                    if "---" in result_content:
-                        result_parts = result_content.split("---", 2)
-                        if len(result_parts) >= 3:
-                            result_text = result_parts[2].strip()
-                        else:
-                            result_text = result_content
+                    result_split = split_frontmatter(result_content)
+                    if result_split is not None:
+                        result_text = result_split[1].strip()
                     else:
                         result_text = result_content
 
@@ -248,37 +242,38 @@ class BaseSpecAgent(BaseWatcher):
         self, out_dir: Path, prompt_timestamp: float, conversation_id: str | None = None
     ) -> Path | None:
         """Matches result files by conversation_id first, then timestamp as fallback."""
+        # One directory read serves both matching passes
+        with os.scandir(out_dir) as entries:
+            result_files = [
+                entry for entry in entries if entry.name.endswith("_result.md") and entry.is_file()
+            ]
+
         # Try UUID-based matching first if conversation_id is provided
         if conversation_id:
-            for result_file in out_dir.glob("*_result.md"):
+            for entry in result_files:
                 try:
-                    content = result_file.read_text(encoding="utf-8")
+                    content = Path(entry.path).read_text(encoding="utf-8")
                     # Parse frontmatter to check conversation_id
-                    if "---" not in content:
+                    split = split_frontmatter(content)
+                    if split is None:
                         continue
 
-                    parts = content.split("---", 2)
-                    if len(parts) < 3:
-                        continue
-
-                    import yaml
-
-                    frontmatter = yaml.safe_load(parts[1])
+                    frontmatter = yaml.safe_load(split[0])
                     if (
                         isinstance(frontmatter, dict)
                         and frontmatter.get("conversation_id") == conversation_id
                     ):
-                        return result_file
+                        return Path(entry.path)
                 except Exception:
                     # Skip files that can't be parsed
                     continue
 
         # Fall back to timestamp-based matching (legacy support)
         tolerance = 60  # seconds
-        for result_file in out_dir.glob("*_result.md"):
-            result_timestamp = result_file.stat().st_ctime
+        for entry in result_files:
+            result_timestamp = entry.stat().st_ctime
             if abs(result_timestamp - prompt_timestamp) <= tolerance:
-                return result_file
+                return Path(entry.path)
 
         return None
 
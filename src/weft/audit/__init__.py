@@ -2,14 +2,18 @@
 
 from weft.audit.hashing import (
     create_audit_frontmatter,
+    format_utc_timestamp,
     parse_audit_frontmatter,
     sha256_hash,
+    sha256_hash_batch,
     verify_audit_hash,
 )
 
 __all__ = [
     "sha256_hash",
+    "sha256_hash_batch",
     "create_audit_frontmatter",
+    "format_utc_timestamp",
     "parse_audit_frontmatter",
     "verify_audit_hash",
 ]
@@ -2,13 +2,38 @@
 
 import hashlib
 import re
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+# hashlib releases the GIL for large buffers; below this threads cost more than they save
+_PARALLEL_HASH_MIN_BYTES = 1 << 20
+
 
 def sha256_hash(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
+def _sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_hash_batch(texts: Sequence[str]) -> list[str]:
+    encoded = [text.encode("utf-8") for text in texts]
+    if len(encoded) < 2 or sum(map(len, encoded)) < _PARALLEL_HASH_MIN_BYTES:
+        return [_sha256_hex(data) for data in encoded]
+
+    with ThreadPoolExecutor() as pool:
+        return list(pool.map(_sha256_hex, encoded))
+
+
+def format_utc_timestamp(moment: datetime) -> str:
+    # isoformat() is C-implemented and beats strftime or a field-wise f-string
+    return moment.astimezone(UTC).isoformat().replace("+00:00", "Z")
+
+
 def create_audit_frontmatter(
     feature: str,
     agent: str,
@@ -16,8 +41,9 @@ def create_audit_frontmatter(
     output_hash: str,
     spec_version: str = "1.0.0",
     conversation_id: str | None = None,
+    generated_at: str | None = None,
 ) -> str:
-    timestamp = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+    timestamp = generated_at or format_utc_timestamp(datetime.now(UTC))
 
     frontmatter = f"""---
 feature: {feature}
@@ -36,9 +62,7 @@ output_hash: {output_hash}"""
 
 
 def parse_audit_frontmatter(content: str) -> dict[str, str]:
-    # Match frontmatter between --- delimiters at start of content
-    pattern = r"^---\s*\n(.*?)\n---\s*\n"
-    match = re.match(pattern, content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
 
     if not match:
         return {}
@@ -61,8 +85,7 @@ def parse_audit_frontmatter(content: str) -> dict[str, str]:
 def verify_audit_hash(content: str, expected_hash: str) -> bool:
     """Strips frontmatter before computing hash."""
     # Strip frontmatter if present
-    pattern = r"^---\s*\n.*?\n---\s*\n"
-    stripped_content = re.sub(pattern, "", content, count=1, flags=re.DOTALL)
+    stripped_content = _FRONTMATTER_RE.sub("", content, count=1)
 
     # Strip leading/trailing whitespace for comparison
     stripped_content = stripped_content.strip()
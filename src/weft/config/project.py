@@ -1,5 +1,6 @@
 """Project configuration loading and validation from .weftrc.yaml."""
 
+import re
 from pathlib import Path
 
 import yaml
@@ -7,6 +8,20 @@ from pydantic import BaseModel, ValidationError
 
 from .errors import ConfigError
 
+_SECRET_PATTERNS = (
+    "api_key",
+    "api-key",
+    "apikey",
+    "secret",
+    "password",
+    "token",
+    "sk-ant-",
+    "sk-",
+    "bearer",
+)
+# One alternation scans each value once instead of once per pattern
+_SECRET_PATTERN_RE = re.compile("|".join(map(re.escape, _SECRET_PATTERNS)))
+
 
 class ProjectConfig(BaseModel):
     name: str
@@ -137,22 +152,10 @@ def load_weftrc(path: Path | None = None) -> WeftRC | None:
 
 def contains_secrets(data: dict) -> bool:
     """Check if config contains secret-like values."""
-    secret_patterns = [
-        "api_key",
-        "api-key",
-        "apikey",
-        "secret",
-        "password",
-        "token",
-        "sk-ant-",
-        "sk-",
-        "bearer",
-    ]
 
     def check_value(v):  # type: ignore[no-untyped-def]
         if isinstance(v, str):
-            lower = v.lower()
-            return any(pattern in lower for pattern in secret_patterns)
+            return _SECRET_PATTERN_RE.search(v.lower()) is not None
         elif isinstance(v, dict):
             return any(check_value(val) for val in v.values())
         elif isinstance(v, list):
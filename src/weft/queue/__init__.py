@@ -12,9 +12,11 @@ from weft.queue.models import (
     PromptTask,
     ResultTask,
     TaskStatus,
+    is_valid_frontmatter,
     markdown_to_prompt,
     prompt_to_markdown,
     result_to_markdown,
+    split_frontmatter,
 )
 
 __all__ = [
@@ -24,6 +26,8 @@ __all__ = [
     "prompt_to_markdown",
     "markdown_to_prompt",
     "result_to_markdown",
+    "is_valid_frontmatter",
+    "split_frontmatter",
     "write_prompt",
     "read_prompt",
     "write_result",
@@ -1,6 +1,6 @@
 """File-based task queue operations."""
 
-import shutil
+import os
 import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
@@ -57,19 +57,20 @@ def write_prompt(
         encoding="utf-8",
     ) as tmp:
         tmp.write(content)
-        tmp_path = Path(tmp.name)
 
-    # Atomic move (rename is atomic on POSIX systems)
-    shutil.move(str(tmp_path), str(target_path))
+    # Same-directory rename: atomic, and unlike shutil.move it skips the isdir/samefile stats
+    os.replace(tmp.name, target_path)
 
     return target_path
 
 
 def read_prompt(prompt_file: Path) -> PromptTask:
-    if not prompt_file.exists():
-        raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
+    # Prompts are a few KB, so a single read beats an exists() stat or mapping the file
+    try:
+        content = prompt_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt file not found: {prompt_file}") from None
 
-    content = prompt_file.read_text(encoding="utf-8")
     return markdown_to_prompt(content)
 
 
@@ -102,37 +103,40 @@ def write_result(
         encoding="utf-8",
     ) as tmp:
         tmp.write(content)
-        tmp_path = Path(tmp.name)
 
     # Atomic move
-    shutil.move(str(tmp_path), str(target_path))
+    os.replace(tmp.name, target_path)
 
     return target_path
 
 
 def mark_processed(prompt_file: Path) -> Path:
-    if not prompt_file.exists():
-        raise FileNotFoundError(f"File not found: {prompt_file}")
-
-    # Rename .md to .processed
+    # Rename .md to .processed; the rename itself reports a missing file
     processed_path = prompt_file.with_suffix(".processed")
-    prompt_file.rename(processed_path)
+    try:
+        prompt_file.rename(processed_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {prompt_file}") from None
 
     return processed_path
 
 
 def list_pending_prompts(agent_dir: Path) -> list[Path]:
     """Sorted by creation time to ensure FIFO processing."""
-    in_dir = agent_dir / "in"
-
-    # Return empty list if in/ directory doesn't exist
-    if not in_dir.exists():
+    # One directory read serves both the .md filter and the ctime sort key,
+    # and a missing in/ directory surfaces from the read instead of a pre-check
+    try:
+        with os.scandir(agent_dir / "in") as entries:
+            prompts = [
+                (entry.stat().st_ctime, entry.path)
+                for entry in entries
+                if entry.name.endswith(".md") and entry.is_file()
+            ]
+    except FileNotFoundError:
         return []
 
-    # Get all .md files (excludes .processed)
-    prompts = list(in_dir.glob("*.md"))
-
-    # Sort by creation time (oldest first) for FIFO processing
-    prompts.sort(key=lambda p: p.stat().st_ctime)
+    # Sort by creation time (oldest first) for FIFO processing. Filesystem ctimes tick
+    # coarsely, so ties fall back to the name, whose microsecond timestamp orders writes
+    prompts.sort()
 
-    return prompts
+    return [Path(path) for _, path in prompts]
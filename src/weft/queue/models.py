@@ -4,19 +4,37 @@ Defines structures for prompts, results, and task status that are
 serialized to/from markdown files with YAML frontmatter.
 """
 
-from dataclasses import dataclass
+import re
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import yaml
 
-from weft.audit.hashing import create_audit_frontmatter
+from weft.audit.hashing import create_audit_frontmatter, format_utc_timestamp
 
 if TYPE_CHECKING:
     from weft.code.models import CodeArtifact
 
 
+_FRONTMATTER_RE = re.compile(
+    r"\A\s*---[ \t]*\r?\n(.*?)^---[ \t]*\r?$\n?(.*)\Z", re.DOTALL | re.MULTILINE
+)
+
+_PROMPT_REQUIRED_FIELDS = tuple(
+    (key, f"Missing required field '{key}' in frontmatter") for key in ("feature", "agent")
+)
+
+# Leading characters that give a YAML scalar non-string meaning or cannot start a plain scalar
+_YAML_INDICATORS = frozenset("'\"{}[],:&*!|>%@`#-?~")
+
+# safe_load's own implicit typing, so values like null, true or 2.0 defer to YAML
+_YAML_RESOLVER = yaml.resolver.Resolver()
+_YAML_STR_TAG = "tag:yaml.org,2002:str"
+
+
 class TaskStatus(Enum):
     PENDING = "pending"
     PROCESSING = "processing"
@@ -25,7 +43,7 @@ class TaskStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PromptTask:
     feature_id: str
     agent_id: str
@@ -35,7 +53,7 @@ class PromptTask:
     conversation_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResultTask:
     feature_id: str
     agent_id: str
@@ -45,56 +63,165 @@ class ResultTask:
     timestamp: datetime
     code_artifact: Optional["CodeArtifact"] = None
     conversation_id: str | None = None
+    _timestamp_iso: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def timestamp_iso(self) -> str:
+        # Formatted once and reused when the same result is serialized repeatedly
+        cached = self._timestamp_iso
+        if cached is None:
+            cached = format_utc_timestamp(self.timestamp)
+            object.__setattr__(self, "_timestamp_iso", cached)
+        return cached
+
+
+def _intern(value: str) -> str:
+    # YAML-parsed frontmatter may yield non-str scalars, which cannot be interned
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _new_prompt(
+    feature_id: str,
+    agent_id: str,
+    prompt_text: str,
+    spec_version: str,
+    revision: int | None,
+    conversation_id: str | None,
+) -> PromptTask:
+    # Parsed fields are already complete, so skip the generated __init__
+    prompt = object.__new__(PromptTask)
+    set_field = object.__setattr__
+    set_field(prompt, "feature_id", feature_id)
+    # Agent ids and spec versions come from a tiny set, so share one string object each
+    set_field(prompt, "agent_id", _intern(agent_id))
+    set_field(prompt, "prompt_text", prompt_text)
+    set_field(prompt, "spec_version", _intern(spec_version))
+    set_field(prompt, "revision", revision)
+    set_field(prompt, "conversation_id", conversation_id)
+    return prompt
+
+
+def _is_plain_str(value: str) -> bool:
+    """True when YAML reads the bare single-line value back as this exact string."""
+    return (
+        value != ""
+        and value.isprintable()
+        and value == value.strip()
+        and value[0] not in _YAML_INDICATORS
+        and value[-1] != ":"
+        and ": " not in value
+        and "#" not in value
+        and _YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) == _YAML_STR_TAG
+    )
 
 
-def prompt_to_markdown(prompt: PromptTask) -> str:
-    frontmatter: dict[str, str | int] = {
-        "feature": prompt.feature_id,
-        "agent": prompt.agent_id,
-        "prompt_spec_version": prompt.spec_version,
-    }
+def _frontmatter_line(key: str, value: Any) -> str:
+    if isinstance(value, str):
+        if _is_plain_str(value):
+            return f"{key}: {value}\n"
+    elif isinstance(value, int) and not isinstance(value, bool):
+        return f"{key}: {value}\n"
+    # Anything YAML would retype, truncate or reject is quoted by PyYAML itself
+    line: str = yaml.safe_dump({key: value}, allow_unicode=True, width=float("inf"))
+    return line
 
-    if prompt.revision is not None:
-        frontmatter["revision"] = prompt.revision
 
-    if prompt.conversation_id is not None:
-        frontmatter["conversation_id"] = prompt.conversation_id
+def prompt_to_markdown(prompt: PromptTask) -> str:
+    # Plain values are emitted directly; only values YAML would misread go through yaml.dump
+    parts = [
+        "---\n",
+        _frontmatter_line("feature", prompt.feature_id),
+        _frontmatter_line("agent", prompt.agent_id),
+        _frontmatter_line("prompt_spec_version", prompt.spec_version),
+    ]
 
-    yaml_str = yaml.dump(frontmatter, default_flow_style=False, sort_keys=False)
-    return f"---\n{yaml_str}---\n\n{prompt.prompt_text}"
+    if prompt.revision is not None:
+        parts.append(_frontmatter_line("revision", prompt.revision))
+
+    if prompt.conversation_id:
+        parts.append(_frontmatter_line("conversation_id", prompt.conversation_id))
+
+    parts.append("---\n\n")
+    parts.append(prompt.prompt_text)
+    return "".join(parts)
+
+
+def split_frontmatter(content: str) -> tuple[str, str] | None:
+    """Returns (frontmatter, body) when content opens with a closed '---' block, else None."""
+    # Plain text without a leading delimiter is rejected before any scanning
+    if not content.startswith("---") and not content[:1].isspace():
+        return None
+
+    if content.startswith("---\n"):
+        end = content.find("\n---\n", 3)
+        if end != -1:
+            frontmatter = content[4:end]
+            # A CRLF or space-padded delimiter line earlier on is the real close; leave it
+            # to the regex so both paths always split at the same place
+            if "\n---" not in frontmatter and not frontmatter.startswith("---"):
+                return frontmatter, content[end + 5 :]
+
+    # Slow path for CRLF files, trailing spaces on delimiters, or a missing final newline
+    match = _FRONTMATTER_RE.match(content)
+    if match is None:
+        return None
+    return match.group(1), match.group(2)
+
+
+def is_valid_frontmatter(content: str) -> bool:
+    """True when content opens with a closed '---' block; later delimiters alone do not count."""
+    return split_frontmatter(content) is not None
+
+
+def _parse_flat_frontmatter(text: str) -> dict[str, Any] | None:
+    """Parse the plain `key: value` frontmatter we emit; None means defer to YAML."""
+    data: dict[str, Any] = {}
+    for line in text.splitlines():
+        if not line:
+            continue
+        key, sep, value = line.partition(": ")
+        value = value.strip()
+        if not sep or not key.isidentifier():
+            return None
+        if _is_plain_str(value):
+            data[key] = value
+        elif key == "revision" and value.isascii() and value.isdigit() and value[0] != "0":
+            data[key] = int(value)
+        else:
+            return None
+    return data or None
 
 
 def markdown_to_prompt(content: str) -> PromptTask:
-    # Split frontmatter and content
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    split = split_frontmatter(content)
+    if split is None:
         raise ValueError("Invalid markdown format: missing frontmatter delimiters")
+    frontmatter_text, body = split
 
-    # Parse YAML frontmatter
-    try:
-        frontmatter = yaml.safe_load(parts[1])
-    except yaml.YAMLError as e:
-        raise ValueError(f"Invalid YAML frontmatter: {e}") from e
+    frontmatter = _parse_flat_frontmatter(frontmatter_text)
+    if frontmatter is None:
+        try:
+            frontmatter = yaml.safe_load(frontmatter_text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML frontmatter: {e}") from e
 
     if not isinstance(frontmatter, dict):
         raise ValueError("Frontmatter must be a YAML dictionary")
 
-    # Extract required fields
-    if "feature" not in frontmatter:
-        raise ValueError("Missing required field 'feature' in frontmatter")
-    if "agent" not in frontmatter:
-        raise ValueError("Missing required field 'agent' in frontmatter")
+    for key, message in _PROMPT_REQUIRED_FIELDS:
+        if key not in frontmatter:
+            raise ValueError(message)
 
-    # Extract prompt text (everything after second ---)
-    prompt_text = parts[2].strip()
+    prompt_text = body.strip()
 
-    return PromptTask(
+    get = frontmatter.get
+    return _new_prompt(
         feature_id=frontmatter["feature"],
         agent_id=frontmatter["agent"],
         prompt_text=prompt_text,
-        spec_version=frontmatter.get("prompt_spec_version", "1.0.0"),
-        revision=frontmatter.get("revision", 1),
-        conversation_id=frontmatter.get("conversation_id", None),
+        spec_version=get("prompt_spec_version", "1.0.0"),
+        revision=get("revision", 1),
+        conversation_id=get("conversation_id"),
     )
 
 
@@ -107,6 +234,7 @@ def result_to_markdown(result: ResultTask) -> str:
         output_hash=result.output_hash,
         spec_version="1.0.0",  # Could be extracted from result if needed
         conversation_id=result.conversation_id,
+        generated_at=result.timestamp_iso,
     )
 
     # Combine frontmatter with output
@@ -42,7 +42,7 @@ def watch_all_features(agent_id: str, ai_history_path: Path, poll_interval: int
 
     from weft.agents.base_spec_agent import BaseSpecAgent
     from weft.ai.backend import create_backend_from_config
-    from weft.audit.hashing import sha256_hash
+    from weft.audit.hashing import sha256_hash_batch
     from weft.queue.file_ops import list_pending_prompts, mark_processed, read_prompt, write_result
     from weft.queue.models import ResultTask
 
@@ -112,14 +112,15 @@ def watch_all_features(agent_id: str, ai_history_path: Path, poll_interval: int
 
                                 # Read prompt
                                 prompt_task = read_prompt(prompt_file)
-                                prompt_hash = sha256_hash(prompt_task.prompt_text)
 
                                 # Process using BaseSpecAgent (handles spec loading, code extraction, etc.)
                                 start_time = time.time()
                                 output_text = watcher.process_prompt(prompt_task)
                                 duration = time.time() - start_time
 
-                                output_hash = sha256_hash(output_text)
+                                prompt_hash, output_hash = sha256_hash_batch(
+                                    [prompt_task.prompt_text, output_text]
+                                )
 
                                 logger.info(
                                     f"[{feature_id}] Generated output in {duration:.2f}s "
@@ -1,5 +1,10 @@
 """Feature state-related exceptions."""
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from weft.state.feature_state import FeatureStatus
+
 
 class StateError(Exception):
     """Base exception for feature state operations."""
@@ -7,10 +12,13 @@ class StateError(Exception):
     pass
 
 
-class InvalidTransitionError(StateError):
+class InvalidTransitionError(StateError, ValueError):
     """Raised when attempting an invalid state transition."""
 
-    pass
+    def __init__(self, from_state: "FeatureStatus", to_state: "FeatureStatus"):
+        super().__init__(f"Invalid state transition: {from_state} -> {to_state}")
+        self.from_state = from_state
+        self.to_state = to_state
 
 
 class StateFileError(StateError):
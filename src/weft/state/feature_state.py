@@ -1,11 +1,18 @@
 """Feature state management models."""
 
+import json
+import os
+import secrets
+from dataclasses import field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
-import yaml
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+
+from weft.state.exceptions import InvalidTransitionError
 
 
 class FeatureStatus(str, Enum):
@@ -17,10 +24,31 @@ class FeatureStatus(str, Enum):
     DROPPED = "dropped"
 
 
-class StateTransition(BaseModel):
+# COMPLETED and DROPPED are terminal, so they never appear as a source state
+_VALID_TRANSITIONS: frozenset[tuple[FeatureStatus, FeatureStatus]] = frozenset(
+    {
+        (FeatureStatus.DRAFT, FeatureStatus.IN_PROGRESS),
+        (FeatureStatus.DRAFT, FeatureStatus.DROPPED),
+        (FeatureStatus.IN_PROGRESS, FeatureStatus.READY),
+        (FeatureStatus.IN_PROGRESS, FeatureStatus.DRAFT),
+        (FeatureStatus.IN_PROGRESS, FeatureStatus.DROPPED),
+        (FeatureStatus.READY, FeatureStatus.COMPLETED),
+        (FeatureStatus.READY, FeatureStatus.MERGE_CONFLICT),
+        (FeatureStatus.READY, FeatureStatus.IN_PROGRESS),
+        (FeatureStatus.READY, FeatureStatus.DROPPED),
+        (FeatureStatus.MERGE_CONFLICT, FeatureStatus.COMPLETED),  # After resolving and retrying
+        (FeatureStatus.MERGE_CONFLICT, FeatureStatus.READY),  # Go back to ready to retry
+        (FeatureStatus.MERGE_CONFLICT, FeatureStatus.DROPPED),  # Give up
+    }
+)
+
+
+# Transitions are append-only history; slots keep long histories compact
+@pydantic_dataclass(slots=True, frozen=True, kw_only=True)
+class StateTransition:
     from_state: FeatureStatus | None = None
     to_state: FeatureStatus
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=datetime.now)
     reason: str | None = None
 
 
@@ -36,53 +64,30 @@ class FeatureState(BaseModel):
 
     @classmethod
     def load(cls, state_file: Path) -> "FeatureState":
-        if not state_file.exists():
-            raise FileNotFoundError(f"State file not found: {state_file}")
-
-        with open(state_file) as f:
-            data = yaml.safe_load(f)
-
-        # Convert timestamp strings to datetime
-        data["created_at"] = datetime.fromisoformat(data["created_at"])
-        data["last_activity"] = datetime.fromisoformat(data["last_activity"])
+        content = _read_state_file(state_file)
+        if _is_json_state(content):
+            return cls.model_validate_json(content)
 
-        # Convert status string to enum
-        data["status"] = FeatureStatus(data["status"])
+        return cls.model_validate(_load_legacy_yaml(content))
 
-        # Convert transition timestamps and status strings to enums
-        for t in data.get("transitions", []):
-            t["timestamp"] = datetime.fromisoformat(t["timestamp"])
-            if t.get("from_state"):
-                t["from_state"] = FeatureStatus(t["from_state"])
-            t["to_state"] = FeatureStatus(t["to_state"])
-
-        return cls(**data)
+    @classmethod
+    def load_if_status(cls, state_file: Path, status: FeatureStatus) -> "FeatureState | None":
+        """Skips full model validation for states that do not match the filter."""
+        content = _read_state_file(state_file)
+        data = json.loads(content) if _is_json_state(content) else _load_legacy_yaml(content)
+        if not isinstance(data, dict) or data.get("status") != status.value:
+            return None
+        return cls.model_validate(data)
 
     def save(self, state_file: Path) -> None:
-        state_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Convert to dict with ISO format timestamps and enum values
-        data = self.model_dump()
-        data["created_at"] = self.created_at.isoformat()
-        data["last_activity"] = self.last_activity.isoformat()
-        data["status"] = self.status.value  # Convert enum to string
-
-        # Convert transition timestamps and enum values
-        for t in data["transitions"]:
-            if isinstance(t["timestamp"], datetime):
-                t["timestamp"] = t["timestamp"].isoformat()
-            elif isinstance(t["timestamp"], str):
-                # Already a string, ensure it's ISO format
-                t["timestamp"] = datetime.fromisoformat(t["timestamp"]).isoformat()
-
-            # Convert from_state and to_state enums to strings
-            if t.get("from_state") and isinstance(t["from_state"], FeatureStatus):
-                t["from_state"] = t["from_state"].value
-            if isinstance(t["to_state"], FeatureStatus):
-                t["to_state"] = t["to_state"].value
-
-        with open(state_file, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        # JSON is a YAML subset, so state.yaml stays readable by YAML tooling
+        content = self.model_dump_json(indent=2)
+        try:
+            _write_state_file(state_file, content)
+        except FileNotFoundError:
+            # Parents only need creating on a feature's first save
+            state_file.parent.mkdir(parents=True, exist_ok=True)
+            _write_state_file(state_file, content)
 
     def transition_to(self, new_status: FeatureStatus, reason: str | None = None) -> None:
         """Validates and records state transition."""
@@ -92,40 +97,21 @@ class FeatureState(BaseModel):
 
         # Validate transition
         if not self._is_valid_transition(new_status):
-            raise ValueError(f"Invalid state transition: {self.status} -> {new_status}")
+            raise InvalidTransitionError(self.status, new_status)
 
-        # Record transition
-        transition = StateTransition(from_state=self.status, to_state=new_status, reason=reason)
+        # Transition timestamp and last_activity share one clock read
+        now = datetime.now()
+        transition = StateTransition(
+            from_state=self.status, to_state=new_status, timestamp=now, reason=reason
+        )
         self.transitions.append(transition)
 
         # Update status
         self.status = new_status
-        self.last_activity = datetime.now()
+        self.last_activity = now
 
     def _is_valid_transition(self, new_status: FeatureStatus) -> bool:
-        valid_transitions = {
-            FeatureStatus.DRAFT: [FeatureStatus.IN_PROGRESS, FeatureStatus.DROPPED],
-            FeatureStatus.IN_PROGRESS: [
-                FeatureStatus.READY,
-                FeatureStatus.DRAFT,
-                FeatureStatus.DROPPED,
-            ],
-            FeatureStatus.READY: [
-                FeatureStatus.COMPLETED,
-                FeatureStatus.MERGE_CONFLICT,
-                FeatureStatus.IN_PROGRESS,
-                FeatureStatus.DROPPED,
-            ],
-            FeatureStatus.MERGE_CONFLICT: [
-                FeatureStatus.COMPLETED,  # After resolving and retrying merge
-                FeatureStatus.READY,  # Go back to ready to retry
-                FeatureStatus.DROPPED,  # Give up
-            ],
-            FeatureStatus.COMPLETED: [],  # Terminal state
-            FeatureStatus.DROPPED: [],  # Terminal state
-        }
-
-        return new_status in valid_transitions.get(self.status, [])
+        return (self.status, new_status) in _VALID_TRANSITIONS
 
     @staticmethod
     def create_initial(feature_name: str) -> "FeatureState":
@@ -146,6 +132,42 @@ class FeatureState(BaseModel):
         )
 
 
+def _read_state_file(state_file: Path) -> bytes:
+    # Raw bytes go straight to the JSON and YAML parsers without a text decode;
+    # absence is reported by the read itself instead of a separate exists() stat
+    try:
+        return state_file.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"State file not found: {state_file}") from None
+
+
+def _write_state_file(state_file: Path, content: str) -> None:
+    # Write a sibling temp file and rename it so readers never see a partial state
+    tmp_path = state_file.parent / f".{state_file.name}.{secrets.token_hex(4)}.tmp"
+    # Created like a plain open(), so the saved file follows the umask instead of mkstemp's 0600
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(content.encode("utf-8"))
+        os.replace(tmp_path, state_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _load_legacy_yaml(content: bytes) -> Any:
+    # Only state files written before the JSON format need PyYAML
+    import yaml
+
+    # Prefer the libyaml-backed loader; it accepts the same documents as SafeLoader
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(content, Loader=loader)
+
+
+def _is_json_state(content: bytes) -> bool:
+    return content.lstrip().startswith(b"{")
+
+
 def load_feature_state(feature_name: str) -> FeatureState:
     """Load feature state from file."""
     from weft.state.utils import get_state_file
@@ -1,14 +1,26 @@
 """Utility functions for feature state management."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 
 from weft.config.runtime import WeftRuntime
 from weft.state.feature_state import FeatureState, FeatureStatus
 
+# Below this many features, thread start-up costs more than the overlapped reads save
+_PARALLEL_LOAD_MIN_FEATURES = 5
+_PARALLEL_LOAD_WORKERS = 8
+
+
+@lru_cache(maxsize=1)
+def _runtime() -> WeftRuntime:
+    # The runtime root is a fixed relative path, so one instance serves every lookup
+    return WeftRuntime()
+
 
 def get_state_file(feature_name: str) -> Path:
-    runtime = WeftRuntime()
-    return runtime.base_dir / "features" / feature_name / "state.yaml"
+    return Path(_runtime().base_dir, "features", feature_name, "state.yaml")
 
 
 def get_feature_state(feature_name: str) -> FeatureState:
@@ -22,30 +34,34 @@ def get_feature_state(feature_name: str) -> FeatureState:
     return FeatureState.load(state_file)
 
 
+def _load_feature_dir(feature_dir: str, status: FeatureStatus | None) -> FeatureState | None:
+    state_file = Path(feature_dir, "state.yaml")
+    try:
+        if status is None:
+            return FeatureState.load(state_file)
+        return FeatureState.load_if_status(state_file, status)
+    except Exception:
+        # Skip missing or invalid state files
+        return None
+
+
 def list_features_by_state(
     status: FeatureStatus | None = None,
 ) -> list[FeatureState]:
-    runtime = WeftRuntime()
-    features_dir = runtime.base_dir / "features"
+    features_dir = Path(_runtime().base_dir, "features")
 
-    if not features_dir.exists():
+    try:
+        # scandir reuses dirent type bits, avoiding a stat per entry for is_dir()
+        with os.scandir(features_dir) as entries:
+            feature_dirs = [entry.path for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
         return []
 
-    states = []
-    for feature_dir in features_dir.iterdir():
-        if not feature_dir.is_dir():
-            continue
-
-        state_file = feature_dir / "state.yaml"
-        if not state_file.exists():
-            continue
-
-        try:
-            state = FeatureState.load(state_file)
-            if status is None or state.status == status:
-                states.append(state)
-        except Exception:
-            # Skip invalid state files
-            continue
+    load = partial(_load_feature_dir, status=status)
+    if len(feature_dirs) < _PARALLEL_LOAD_MIN_FEATURES:
+        states = list(map(load, feature_dirs))
+    else:
+        with ThreadPoolExecutor(max_workers=_PARALLEL_LOAD_WORKERS) as pool:
+            states = list(pool.map(load, feature_dirs))
 
-    return states
+    return [state for state in states if state is not None]
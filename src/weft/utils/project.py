@@ -4,18 +4,27 @@ from pathlib import Path
 
 from weft.config.errors import ConfigError
 
+# Keyed by resolved directory. Only found roots are cached, so `weft init` in a directory
+# with no project above it is seen on the next lookup. A project nested inside an
+# already-cached directory is not seen until clear_project_root_cache() is called.
+_root_cache: dict[Path, Path] = {}
+
 
 def find_project_root(start_path: Path | None = None) -> Path | None:
     """Searches for .weftrc.yaml (primary) or .weft/ directory (fallback)."""
-    current = start_path or Path.cwd()
-    current = current.resolve()
+    # Resolve before the lookup so a relative start path is keyed by the directory it names now
+    current = (start_path or Path.cwd()).resolve()
+    visited = []
 
     while True:
-        if (current / ".weftrc.yaml").exists():
-            return current
+        root = _root_cache.get(current)
+        if root is not None:
+            break
 
-        if (current / ".weft").is_dir():
-            return current
+        visited.append(current)
+        if (current / ".weftrc.yaml").exists() or (current / ".weft").is_dir():
+            root = current
+            break
 
         parent = current.parent
         if parent == current:
@@ -23,6 +32,15 @@ def find_project_root(start_path: Path | None = None) -> Path | None:
 
         current = parent
 
+    # Every directory on the way up shares this root, so later lookups from them skip the walk
+    for path in visited:
+        _root_cache[path] = root
+    return root
+
+
+def clear_project_root_cache() -> None:
+    _root_cache.clear()
+
 
 def get_project_root() -> Path:
     root = find_project_root()
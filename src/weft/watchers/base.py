@@ -6,12 +6,13 @@ that all agent watchers inherit.
 
 import logging
 import signal
+import threading
 import time
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
 from pathlib import Path
 
-from weft.audit.hashing import sha256_hash
+from weft.audit.hashing import sha256_hash_batch
 from weft.code.applier import PatchApplier
 from weft.code.models import CodeArtifact
 from weft.code.parser import has_code_patches, parse_code_from_markdown
@@ -43,12 +44,10 @@ class BaseWatcher(ABC):
 
         self.agent_dir = ai_history_path / feature_id / agent_id
         self._running = False
+        self._wake = threading.Event()
         self._original_sigint_handler = None
         self._original_sigterm_handler = None
 
-        # Setup signal handlers
-        self._setup_signal_handlers()
-
         logger.info(f"Initialized watcher: {agent_id} for {feature_id}")
 
     @property
@@ -131,32 +130,55 @@ class BaseWatcher(ABC):
 
     def start(self) -> None:
         self._running = True
+        self._wake.clear()
         logger.info(f"Starting watcher {self.agent_id} for {self.feature_id}")
         logger.info(f"Watching: {self.agent_dir / 'in'}")
         logger.info(f"Poll interval: {self.poll_interval}s")
 
-        while self._running:
-            try:
-                self._process_pending_prompts()
-            except Exception as e:
-                logger.error(f"Error in watch loop: {e}", exc_info=True)
+        # Handlers are only claimed while the loop runs; callers that just use
+        # process_prompt (e.g. run_watcher's multi-feature loop) keep their own
+        self._setup_signal_handlers()
+        try:
+            while self._running:
+                try:
+                    self._process_pending_prompts()
+                except Exception as e:
+                    logger.error(f"Error in watch loop: {e}", exc_info=True)
 
-            time.sleep(self.poll_interval)
+                # Unlike sleep(), the wait ends as soon as stop() is called
+                self._wake.wait(self.poll_interval)
+        finally:
+            self._restore_signal_handlers()
 
         logger.info(f"Stopped watcher {self.agent_id}")
 
     def stop(self) -> None:
         logger.info(f"Stopping watcher {self.agent_id}...")
         self._running = False
+        self._wake.set()
 
     def _setup_signal_handlers(self) -> None:
+        # signal.signal() only works from the main thread
+        if threading.current_thread() is not threading.main_thread():
+            return
+
         # Store original handlers
         self._original_sigint_handler = signal.signal(signal.SIGINT, self._signal_handler)  # type: ignore[assignment]
         self._original_sigterm_handler = signal.signal(signal.SIGTERM, self._signal_handler)  # type: ignore[assignment]
 
+    def _restore_signal_handlers(self) -> None:
+        if self._original_sigint_handler is not None:
+            signal.signal(signal.SIGINT, self._original_sigint_handler)
+            self._original_sigint_handler = None
+        if self._original_sigterm_handler is not None:
+            signal.signal(signal.SIGTERM, self._original_sigterm_handler)
+            self._original_sigterm_handler = None
+
     def _signal_handler(self, signum: int, frame) -> None:  # type: ignore[no-untyped-def]
         logger.info(f"Received signal {signum}, shutting down...")
-        self.stop()
+        # Event.set() from a handler can deadlock on the lock the interrupted wait() holds,
+        # so only clear the flag and let the loop exit at the end of the current wait
+        self._running = False
 
     def _process_pending_prompts(self) -> None:
         pending = list_pending_prompts(self.agent_dir)
@@ -187,14 +209,13 @@ class BaseWatcher(ABC):
 
         # Read prompt
         prompt_task = read_prompt(prompt_file)
-        prompt_hash = sha256_hash(prompt_task.prompt_text)
 
         # Process with subclass implementation
         start_time = time.time()
         output_text = self.process_prompt(prompt_task)
         duration = time.time() - start_time
 
-        output_hash = sha256_hash(output_text)
+        prompt_hash, output_hash = sha256_hash_batch([prompt_task.prompt_text, output_text])
 
         logger.info(
             f"Generated output in {duration:.2f}s "
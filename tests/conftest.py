@@ -1,17 +1,25 @@
 """Pytest configuration and common fixtures for AI Workflow tests."""
 
-import tempfile
 from collections.abc import Generator
 from pathlib import Path
 
 import pytest
 
+from weft.utils.project import clear_project_root_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_project_root_cache() -> Generator[None, None, None]:
+    """Keep project roots found in one test from leaking into the next."""
+    clear_project_root_cache()
+    yield
+    clear_project_root_cache()
+
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
+def temp_dir(tmp_path: Path) -> Path:
     """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
 @pytest.fixture
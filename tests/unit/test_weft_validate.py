@@ -4,6 +4,7 @@ import importlib.util
 import json
 import subprocess
 import sys
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -100,6 +101,22 @@ class TestWeftValidateScript:
         assert len(output["sections"]) == 1
         assert output["sections"][0]["name"].startswith("A)")
 
+    def test_fail_fast_stops_after_first_failing_section(self, script_path, tmp_path, monkeypatch):
+        """Test --fail-fast skips sections after the first failure."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("WEFT_ANTHROPIC_API_KEY", raising=False)
+
+        result = subprocess.run(
+            [sys.executable, str(script_path), "--fail-fast", "--json"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+        output = json.loads(result.stdout)
+        assert result.returncode == 1
+        assert [s["name"] for s in output["sections"]] == ["A) Environment"]
+
     def test_invalid_section_returns_error(self, script_path):
         """Test invalid section argument returns error."""
         result = subprocess.run(
@@ -162,6 +179,11 @@ class TestUtilityFunctions:
         result = weft_validate_module.tail_output(text, lines=5)
         assert result == "\n".join(lines[-5:])
 
+    def test_tail_output_at_line_boundary(self, weft_validate_module):
+        """Test tail_output keeps exactly the limit when text has one line more."""
+        assert weft_validate_module.tail_output("a\nb\nc", lines=3) == "a\nb\nc"
+        assert weft_validate_module.tail_output("a\nb\nc\n", lines=3) == "b\nc\n"
+
     def test_tail_output_empty_text(self, weft_validate_module):
         """Test tail_output with empty text."""
         result = weft_validate_module.tail_output("", lines=10)
@@ -493,6 +515,159 @@ class TestTestValidation:
         assert test_checks[0].status == weft_validate_module.Status.SKIP
 
 
+# =============================================================================
+# SECTION DISPATCH AND OUTPUT TESTS
+# =============================================================================
+
+
+def fake_validators(module, delays=None, calls=None):
+    """Build a validator table whose sections finish after the given delays."""
+
+    def make(letter):
+        def validate(self):
+            if calls is not None:
+                calls.append(letter)
+            time.sleep((delays or {}).get(letter, 0))
+            return module.SectionResult(name=letter)
+
+        return validate
+
+    return {letter: make(letter) for letter in "ABCDE"}
+
+
+@pytest.fixture
+def report_sections(weft_validate_module):
+    """Fixed sections covering every status and a message needing redaction."""
+    m = weft_validate_module
+    return [
+        m.SectionResult(
+            name="A) Environment",
+            checks=[
+                m.Check("Python Version", m.Status.PASS, "Python 3.11.7"),
+                m.Check("ENV: KEY", m.Status.FAIL, "Bad key sk-ant-abc123"),
+            ],
+        ),
+        m.SectionResult(
+            name="C) Commands",
+            checks=[
+                m.Check("pytest", m.Status.WARN, "Not found in PATH"),
+                m.Check("weft up", m.Status.SKIP, "Skipped in quick mode (slow command)"),
+            ],
+        ),
+    ]
+
+
+def run_main(module, sections, argv, capsys):
+    """Run main() against fixed sections and return its exit code and stdout."""
+    with (
+        patch.object(module.WeftValidator, "compute_sections", return_value=sections),
+        patch.object(sys, "argv", ["weft-validate.py", *argv]),
+        pytest.raises(SystemExit) as exc_info,
+    ):
+        module.main()
+    return exc_info.value.code, capsys.readouterr().out
+
+
+class TestSectionDispatch:
+    """Test how sections are selected and ordered."""
+
+    def make_validator(self, module, section=None):
+        args = Mock()
+        args.section = section
+        args.fail_fast = False
+        return module.WeftValidator(args)
+
+    def test_concurrent_sections_keep_declaration_order(self, weft_validate_module):
+        """Test sections come back in A-E order even when later ones finish first."""
+        delays = {"A": 0.2, "B": 0.15, "C": 0.1, "D": 0.05, "E": 0}
+        validator = self.make_validator(weft_validate_module)
+
+        with patch.dict(
+            validator._VALIDATORS, fake_validators(weft_validate_module, delays=delays)
+        ):
+            sections = validator.compute_sections()
+
+        assert [s.name for s in sections] == ["A", "B", "C", "D", "E"]
+
+    def test_section_flag_runs_exactly_one_validator(self, weft_validate_module):
+        """Test --section calls only the selected validator."""
+        calls = []
+        validator = self.make_validator(weft_validate_module, section="c")
+
+        with patch.dict(validator._VALIDATORS, fake_validators(weft_validate_module, calls=calls)):
+            sections = validator.compute_sections()
+
+        assert calls == ["C"]
+        assert [s.name for s in sections] == ["C"]
+
+
+class TestOutputFormat:
+    """Test the report formats stay byte-for-byte stable."""
+
+    def test_json_output(self, weft_validate_module, report_sections, capsys):
+        """Test --json output matches the established structure and formatting."""
+        code, out = run_main(weft_validate_module, report_sections, ["--json"], capsys)
+
+        expected = {
+            "sections": [
+                {
+                    "name": "A) Environment",
+                    "passed": False,
+                    "checks": [
+                        {"name": "Python Version", "status": "pass", "message": "Python 3.11.7"},
+                        {"name": "ENV: KEY", "status": "fail", "message": "Bad key REDACTED"},
+                    ],
+                },
+                {
+                    "name": "C) Commands",
+                    "passed": True,
+                    "checks": [
+                        {"name": "pytest", "status": "warn", "message": "Not found in PATH"},
+                        {
+                            "name": "weft up",
+                            "status": "skip",
+                            "message": "Skipped in quick mode (slow command)",
+                        },
+                    ],
+                },
+            ],
+            "summary": {"total": 4, "passed": 1, "failed": 1, "warned": 1, "skipped": 1},
+        }
+        assert code == 1
+        assert out == json.dumps(expected, indent=2) + "\n"
+
+    def test_pretty_output(self, weft_validate_module, report_sections, capsys):
+        """Test the default report matches the established layout."""
+        code, out = run_main(weft_validate_module, report_sections, [], capsys)
+
+        rule = "=" * 60
+        expected = "\n".join(
+            [
+                "",
+                "A) Environment",
+                rule,
+                "  ✓ Python Version: Python 3.11.7",
+                "  ✗ ENV: KEY: Bad key REDACTED",
+                "",
+                "C) Commands",
+                rule,
+                "  ⚠ pytest: Not found in PATH",
+                "  - weft up: Skipped in quick mode (slow command)",
+                "",
+                rule,
+                "VALIDATION SUMMARY",
+                rule,
+                "Total:   4",
+                "Passed:  1",
+                "Failed:  1",
+                "Warned:  1",
+                "Skipped: 1",
+            ]
+        )
+        assert code == 1
+        assert out == expected + "\n"
+
+
 # =============================================================================
 # EXIT CODE TESTS
 # =============================================================================
@@ -195,3 +195,67 @@ class TestSpecVersionExtraction:
         )
 
         assert agent.spec_version == "1.0.0"
+
+
+class TestConversationHistory:
+    """Tests for loading prior prompt/result pairs."""
+
+    def test_matches_result_by_conversation_id(self, tmp_path, mock_meta_config, mock_spec_content):
+        """Test history pairs each processed prompt with its result file."""
+        spec_path = tmp_path / "00_meta.md"
+        spec_path.write_text(mock_spec_content)
+        agent = BaseSpecAgent(
+            feature_id="feat-test",
+            agent_id="00-meta",
+            ai_history_path=tmp_path / "history",
+            backend=Mock(),
+            config=mock_meta_config,
+            prompt_spec_path=spec_path,
+        )
+        in_dir = agent.agent_dir / "in"
+        out_dir = agent.agent_dir / "out"
+        in_dir.mkdir(parents=True)
+        out_dir.mkdir()
+        (in_dir / "001_prompt.processed").write_text(
+            "---\nfeature: feat-test\nagent: 00-meta\nconversation_id: conv-1\n---\n\nFirst"
+        )
+        (out_dir / "other_result.md").write_text("---\nconversation_id: conv-2\n---\nWrong")
+        (out_dir / "001_result.md").write_text("---\nconversation_id: conv-1\n---\nAnswer")
+        (out_dir / "notes.md").write_text("ignored")
+
+        messages = agent._load_conversation_history("conv-1")
+
+        assert messages == [
+            {"role": "user", "content": "First"},
+            {"role": "assistant", "content": "Answer"},
+        ]
+
+    def test_dashes_inside_frontmatter_values(self, tmp_path, mock_meta_config, mock_spec_content):
+        """Test '---' inside a frontmatter value does not end the frontmatter."""
+        spec_path = tmp_path / "00_meta.md"
+        spec_path.write_text(mock_spec_content)
+        agent = BaseSpecAgent(
+            feature_id="feat-test",
+            agent_id="00-meta",
+            ai_history_path=tmp_path / "history",
+            backend=Mock(),
+            config=mock_meta_config,
+            prompt_spec_path=spec_path,
+        )
+        in_dir = agent.agent_dir / "in"
+        out_dir = agent.agent_dir / "out"
+        in_dir.mkdir(parents=True)
+        out_dir.mkdir()
+        (in_dir / "001_prompt.processed").write_text(
+            "---\nfeature: a---b\nagent: 00-meta\nconversation_id: conv-1\n---\n\nFirst"
+        )
+        (out_dir / "001_result.md").write_text(
+            "---\nsummary: x---y\nconversation_id: conv-1\n---\nAnswer"
+        )
+
+        messages = agent._load_conversation_history("conv-1")
+
+        assert messages == [
+            {"role": "user", "content": "First"},
+            {"role": "assistant", "content": "Answer"},
+        ]
@@ -1,12 +1,14 @@
 """Tests for audit hashing and frontmatter utilities."""
 
 import re
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from weft.audit.hashing import (
     create_audit_frontmatter,
+    format_utc_timestamp,
     parse_audit_frontmatter,
     sha256_hash,
+    sha256_hash_batch,
     verify_audit_hash,
 )
 
@@ -79,6 +81,36 @@ Line 3"""
         assert len(result) == 64
 
 
+class TestSha256HashBatch:
+    """Tests for sha256_hash_batch function."""
+
+    def test_batch_matches_single_hashes(self) -> None:
+        """Test batch results match sha256_hash in input order."""
+        texts = ["prompt", "output", "", "café"]
+
+        assert sha256_hash_batch(texts) == [sha256_hash(text) for text in texts]
+
+    def test_batch_empty(self) -> None:
+        """Test empty batch returns empty list."""
+        assert sha256_hash_batch([]) == []
+
+    def test_batch_large_inputs(self) -> None:
+        """Test large batches take the threaded path and keep ordering."""
+        texts = ["a" * (1 << 20), "b" * (1 << 20), "c"]
+
+        assert sha256_hash_batch(texts) == [sha256_hash(text) for text in texts]
+
+
+class TestFormatUtcTimestamp:
+    """Tests for format_utc_timestamp function."""
+
+    def test_converts_to_utc_with_z_suffix(self) -> None:
+        """Test offsets are normalized to UTC and rendered with Z."""
+        moment = datetime(2025, 12, 11, 22, 0, 0, tzinfo=timezone(timedelta(hours=1)))
+
+        assert format_utc_timestamp(moment) == "2025-12-11T21:00:00Z"
+
+
 class TestCreateAuditFrontmatter:
     """Tests for create_audit_frontmatter function."""
 
@@ -124,6 +156,14 @@ class TestCreateAuditFrontmatter:
         timestamp_str_for_parse = timestamp_str.replace("Z", "+00:00")
         datetime.fromisoformat(timestamp_str_for_parse)
 
+    def test_frontmatter_uses_given_timestamp(self) -> None:
+        """Test generated_at is written as given instead of the current time."""
+        fm = create_audit_frontmatter(
+            "feat/test", "01-architect", "h1", "h2", generated_at="2025-12-11T21:00:00Z"
+        )
+
+        assert "generated_at: 2025-12-11T21:00:00Z" in fm
+
     def test_frontmatter_default_spec_version(self) -> None:
         """Test default spec version is 1.0.0."""
         fm = create_audit_frontmatter("feat/test", "01-architect", "h1", "h2")
@@ -391,7 +391,6 @@ class TestListPendingPrompts:
         prompt2 = PromptTask("feat/test", "01-architect", "Second")
 
         write_prompt(temp_dir, "feat/test", "01-architect", prompt1)
-        time.sleep(0.01)
         write_prompt(temp_dir, "feat/test", "01-architect", prompt2)
 
         agent_dir = temp_dir / "feat/test" / "01-architect"
@@ -458,7 +457,6 @@ class TestIntegration:
         for i in range(5):
             prompt = PromptTask("feat/queue", "01-architect", f"Prompt {i}")
             write_prompt(temp_dir, "feat/queue", "01-architect", prompt)
-            time.sleep(0.01)  # Ensure different timestamps
 
         agent_dir = temp_dir / "feat/queue" / "01-architect"
         pending = list_pending_prompts(agent_dir)
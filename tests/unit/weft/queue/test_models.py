@@ -1,5 +1,6 @@
 """Tests for task queue data models."""
 
+from dataclasses import FrozenInstanceError
 from datetime import UTC, datetime
 
 import pytest
@@ -9,12 +10,19 @@ from weft.queue.models import (
     PromptTask,
     ResultTask,
     TaskStatus,
+    is_valid_frontmatter,
     markdown_to_prompt,
     prompt_to_markdown,
     result_to_markdown,
+    split_frontmatter,
 )
 
 
+@pytest.fixture(scope="module")
+def fixed_ts() -> datetime:
+    return datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+
 class TestTaskStatus:
     """Tests for TaskStatus enum."""
 
@@ -66,6 +74,17 @@ class TestPromptTask:
         assert prompt.spec_version == "1.0.0"
         assert prompt.revision is None
 
+    def test_prompt_task_is_immutable(self) -> None:
+        """Test PromptTask fields cannot be reassigned after creation."""
+        prompt = PromptTask(
+            feature_id="feat/test",
+            agent_id="01-architect",
+            prompt_text="Test prompt",
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            prompt.revision = 2  # type: ignore[misc]
+
     def test_prompt_task_custom_values(self) -> None:
         """Test PromptTask with custom spec_version and revision."""
         prompt = PromptTask(
@@ -83,16 +102,15 @@ class TestPromptTask:
 class TestResultTask:
     """Tests for ResultTask dataclass."""
 
-    def test_result_task_creation(self) -> None:
+    def test_result_task_creation(self, fixed_ts: datetime) -> None:
         """Test creating a ResultTask with all fields."""
-        timestamp = datetime.now(UTC)
         result = ResultTask(
             feature_id="feat/test",
             agent_id="01-architect",
             output_text="Architecture design document...",
             prompt_hash="abc123",
             output_hash="def456",
-            timestamp=timestamp,
+            timestamp=fixed_ts,
         )
 
         assert result.feature_id == "feat/test"
@@ -100,9 +118,23 @@ class TestResultTask:
         assert result.output_text == "Architecture design document..."
         assert result.prompt_hash == "abc123"
         assert result.output_hash == "def456"
-        assert result.timestamp == timestamp
+        assert result.timestamp == fixed_ts
+
+    def test_result_task_timestamp_iso_cached(self, fixed_ts: datetime) -> None:
+        """Test the formatted timestamp is computed once and reused."""
+        result = ResultTask(
+            feature_id="feat/test",
+            agent_id="01-architect",
+            output_text="Output",
+            prompt_hash="abc123",
+            output_hash="def456",
+            timestamp=fixed_ts,
+        )
 
-    def test_result_task_with_real_hashes(self) -> None:
+        assert result.timestamp_iso == "2024-01-01T12:00:00Z"
+        assert result.timestamp_iso is result.timestamp_iso
+
+    def test_result_task_with_real_hashes(self, fixed_ts: datetime) -> None:
         """Test ResultTask with actual SHA256 hashes."""
         prompt_text = "Design a system"
         output_text = "System design..."
@@ -115,7 +147,7 @@ class TestResultTask:
             output_text=output_text,
             prompt_hash=prompt_hash,
             output_hash=output_hash,
-            timestamp=datetime.now(UTC),
+            timestamp=fixed_ts,
         )
 
         assert len(result.prompt_hash) == 64
@@ -186,6 +218,42 @@ class TestPromptToMarkdown:
         assert "quotes" in markdown
         assert "symbols" in markdown
 
+    def test_prompt_to_markdown_skips_empty_conversation_id(self) -> None:
+        """Test an empty conversation_id is not written as a blank field."""
+        prompt = PromptTask(
+            feature_id="feat/test",
+            agent_id="01-architect",
+            prompt_text="Test",
+            conversation_id="",
+        )
+
+        markdown = prompt_to_markdown(prompt)
+
+        assert "conversation_id" not in markdown
+
+    def test_prompt_to_markdown_conversation_id(self) -> None:
+        """Test conversation_id is emitted after the spec fields."""
+        prompt = PromptTask(
+            feature_id="feat/conv",
+            agent_id="01-architect",
+            prompt_text="Test",
+            revision=2,
+            conversation_id="feat-conv-01-architect",
+        )
+
+        markdown = prompt_to_markdown(prompt)
+
+        assert markdown == (
+            "---\n"
+            "feature: feat/conv\n"
+            "agent: 01-architect\n"
+            "prompt_spec_version: 1.0.0\n"
+            "revision: 2\n"
+            "conversation_id: feat-conv-01-architect\n"
+            "---\n\n"
+            "Test"
+        )
+
 
 class TestMarkdownToPrompt:
     """Tests for markdown_to_prompt function."""
@@ -243,6 +311,93 @@ Line 3"""
         assert "Line 2" in prompt.prompt_text
         assert "Line 3" in prompt.prompt_text
 
+    def test_markdown_to_prompt_quoted_values(self) -> None:
+        """Test quoted YAML scalars are still unquoted on parse."""
+        content = """---
+feature: "feat/quoted"
+agent: '01-architect'
+---
+
+Prompt text"""
+
+        prompt = markdown_to_prompt(content)
+
+        assert prompt.feature_id == "feat/quoted"
+        assert prompt.agent_id == "01-architect"
+
+    def test_markdown_to_prompt_types_values_like_yaml(self) -> None:
+        """Test plain values YAML would type are parsed exactly as yaml.safe_load does."""
+        content = """---
+feature: feat/version
+agent: 01-architect
+prompt_spec_version: 2.0
+conversation_id: null
+---
+
+Prompt text"""
+
+        prompt = markdown_to_prompt(content)
+
+        assert prompt.spec_version == 2.0
+        assert prompt.conversation_id is None
+
+    def test_markdown_to_prompt_strips_extra_spaces(self) -> None:
+        """Test extra spaces after the colon are not kept in the value."""
+        content = "---\nfeature:  feat/spaced\nagent: 01-architect\n---\n\nPrompt text"
+
+        prompt = markdown_to_prompt(content)
+
+        assert prompt.feature_id == "feat/spaced"
+
+    def test_markdown_to_prompt_tilde_conversation_id(self) -> None:
+        """Test a '~' conversation id means no conversation."""
+        content = "---\nfeature: feat/a\nagent: 01-architect\nconversation_id: ~\n---\n\nText"
+
+        assert markdown_to_prompt(content).conversation_id is None
+
+    def test_markdown_to_prompt_rejects_text_before_frontmatter(self) -> None:
+        """Test frontmatter must open the file rather than follow other text."""
+        content = "Preamble\n---\nfeature: feat/a\nagent: 01-architect\n---\n\nText"
+
+        with pytest.raises(ValueError, match="missing frontmatter delimiters"):
+            markdown_to_prompt(content)
+
+    def test_markdown_to_prompt_crlf_line_endings(self) -> None:
+        """Test parsing files saved with Windows line endings."""
+        content = "---\r\nfeature: feat/crlf\r\nagent: 01-architect\r\n---\r\n\r\nPrompt text"
+
+        prompt = markdown_to_prompt(content)
+
+        assert prompt.feature_id == "feat/crlf"
+        assert prompt.agent_id == "01-architect"
+        assert prompt.prompt_text == "Prompt text"
+
+    def test_markdown_to_prompt_interns_agent_id(self) -> None:
+        """Test parsed prompts share agent_id and spec_version strings."""
+        content = prompt_to_markdown(
+            PromptTask(feature_id="feat/a", agent_id="01-architect", prompt_text="Test")
+        )
+
+        first = markdown_to_prompt(content)
+        second = markdown_to_prompt(content)
+
+        assert first.agent_id is second.agent_id
+        assert first.spec_version is second.spec_version
+
+    def test_markdown_to_prompt_yaml_scalar_version(self) -> None:
+        """Test non-string YAML scalars from the fallback parser are accepted."""
+        content = """---
+feature: feat/yaml
+agent: 01-architect
+prompt_spec_version: 2.0  # pinned
+---
+
+Prompt text"""
+
+        prompt = markdown_to_prompt(content)
+
+        assert str(prompt.spec_version) == "2.0"
+
     def test_markdown_to_prompt_invalid_no_delimiters(self) -> None:
         """Test parsing fails without frontmatter delimiters."""
         content = "Just some text without frontmatter"
@@ -294,10 +449,55 @@ Prompt text"""
             markdown_to_prompt(content)
 
 
+class TestIsValidFrontmatter:
+    """Tests for is_valid_frontmatter function."""
+
+    def test_valid_prompt_markdown(self) -> None:
+        """Test serialized prompts are recognized."""
+        prompt = PromptTask(feature_id="feat/a", agent_id="01-architect", prompt_text="x")
+
+        assert is_valid_frontmatter(prompt_to_markdown(prompt))
+
+    def test_body_delimiters_do_not_count(self) -> None:
+        """Test '---' inside the body alone is not treated as frontmatter."""
+        assert not is_valid_frontmatter("Intro\n---\nfeature: x\n---\nbody")
+
+    def test_unterminated_frontmatter(self) -> None:
+        """Test an opening delimiter without a closing one is rejected."""
+        assert not is_valid_frontmatter("---\nfeature: x\nbody")
+
+
+class TestSplitFrontmatter:
+    """Tests for split_frontmatter function."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "---\nfeature: x\r\n---\r\nbody\n---\nmore",
+            "---\nfeature: x\n--- \nbody\n---\nmore",
+            "---\n---\r\nbody\n---\nmore",
+        ],
+    )
+    def test_earliest_delimiter_closes_mixed_line_endings(self, content: str) -> None:
+        """Test a CRLF or padded closing line wins over a later LF delimiter."""
+        frontmatter, body = split_frontmatter(content)
+
+        assert "body" in body
+        assert "more" in body
+        assert "body" not in frontmatter
+
+    def test_dashes_inside_values_stay_in_frontmatter(self) -> None:
+        """Test '---' within a value does not split the block early."""
+        assert split_frontmatter("---\nfeature: a---b\n---\nbody\n---\nmore") == (
+            "feature: a---b",
+            "body\n---\nmore",
+        )
+
+
 class TestResultToMarkdown:
     """Tests for result_to_markdown function."""
 
-    def test_result_to_markdown_basic(self) -> None:
+    def test_result_to_markdown_basic(self, fixed_ts: datetime) -> None:
         """Test basic result serialization."""
         result = ResultTask(
             feature_id="feat/test",
@@ -305,7 +505,7 @@ class TestResultToMarkdown:
             output_text="Architecture design document",
             prompt_hash="abc123",
             output_hash="def456",
-            timestamp=datetime.now(UTC),
+            timestamp=fixed_ts,
         )
 
         markdown = result_to_markdown(result)
@@ -318,7 +518,22 @@ class TestResultToMarkdown:
         assert "generated_at:" in markdown
         assert "Architecture design document" in markdown
 
-    def test_result_to_markdown_multiline(self) -> None:
+    def test_result_to_markdown_uses_result_timestamp(self) -> None:
+        """Test generated_at is taken from the result, not the clock."""
+        result = ResultTask(
+            feature_id="feat/test",
+            agent_id="01-architect",
+            output_text="Output",
+            prompt_hash="abc123",
+            output_hash="def456",
+            timestamp=datetime(2025, 12, 11, 21, 0, 0, tzinfo=UTC),
+        )
+
+        markdown = result_to_markdown(result)
+
+        assert "generated_at: 2025-12-11T21:00:00Z" in markdown
+
+    def test_result_to_markdown_multiline(self, fixed_ts: datetime) -> None:
         """Test result with multiline output."""
         result = ResultTask(
             feature_id="feat/multi",
@@ -326,7 +541,7 @@ class TestResultToMarkdown:
             output_text="# API Design\n\n## Endpoints\n\n- GET /api/users",
             prompt_hash="hash1",
             output_hash="hash2",
-            timestamp=datetime.now(UTC),
+            timestamp=fixed_ts,
         )
 
         markdown = result_to_markdown(result)
@@ -335,7 +550,7 @@ class TestResultToMarkdown:
         assert "## Endpoints" in markdown
         assert "- GET /api/users" in markdown
 
-    def test_result_to_markdown_with_real_hashes(self) -> None:
+    def test_result_to_markdown_with_real_hashes(self, fixed_ts: datetime) -> None:
         """Test result serialization with actual hashes."""
         prompt_text = "Design an API"
         output_text = "API Design Document"
@@ -349,7 +564,7 @@ class TestResultToMarkdown:
             output_text=output_text,
             prompt_hash=prompt_hash,
             output_hash=output_hash,
-            timestamp=datetime.now(UTC),
+            timestamp=fixed_ts,
         )
 
         markdown = result_to_markdown(result)
@@ -363,6 +578,45 @@ class TestResultToMarkdown:
 class TestRoundTrip:
     """Integration tests for serialization round-trips."""
 
+    @pytest.mark.parametrize(
+        "value",
+        ["yes", "null", "123", "1.0", "a #b", "a: b", "'x'", "line one\nline two", "off", "~"],
+    )
+    def test_prompt_roundtrip_keeps_yaml_lookalike_strings(self, value: str) -> None:
+        """Test string values YAML would retype, truncate or reject survive a round trip."""
+        original = PromptTask(
+            feature_id=value, agent_id="01-architect", prompt_text="Body", spec_version=value
+        )
+
+        parsed = markdown_to_prompt(prompt_to_markdown(original))
+
+        assert parsed.feature_id == value
+        assert parsed.spec_version == value
+        assert parsed.prompt_text == "Body"
+
+    @pytest.mark.parametrize("conversation_id", ["2024-01-01", "123", "true"])
+    def test_prompt_roundtrip_keeps_conversation_id_a_string(self, conversation_id: str) -> None:
+        """Test date- or number-like conversation ids are not retyped by YAML."""
+        original = PromptTask(
+            feature_id="feat/a",
+            agent_id="01-architect",
+            prompt_text="Body",
+            conversation_id=conversation_id,
+        )
+
+        parsed = markdown_to_prompt(prompt_to_markdown(original))
+
+        assert parsed.conversation_id == conversation_id
+
+    def test_prompt_to_markdown_leaves_plain_values_bare(self) -> None:
+        """Test ordinary values are written without quotes."""
+        markdown = prompt_to_markdown(
+            PromptTask(feature_id="feat/plain", agent_id="01-architect", prompt_text="x")
+        )
+
+        assert "feature: feat/plain\n" in markdown
+        assert "prompt_spec_version: 1.0.0\n" in markdown
+
     def test_prompt_roundtrip(self) -> None:
         """Test PromptTask serialization and deserialization."""
         original = PromptTask(
@@ -426,3 +680,18 @@ Consider scalability and security.""",
         parsed = markdown_to_prompt(markdown)
 
         assert parsed.prompt_text == original.prompt_text
+
+    def test_prompt_roundtrip_equals_original(self) -> None:
+        """Test parsed PromptTask compares equal to a constructed one."""
+        original = PromptTask(
+            feature_id="feat/eq",
+            agent_id="01-architect",
+            prompt_text="Compare me",
+            spec_version="1.2.3",
+            revision=4,
+            conversation_id="feat-eq-01-architect",
+        )
+
+        parsed = markdown_to_prompt(prompt_to_markdown(original))
+
+        assert parsed == original
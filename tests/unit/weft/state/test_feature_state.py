@@ -1,6 +1,8 @@
 """Unit tests for feature state management."""
 
-import tempfile
+import os
+import stat
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -8,8 +10,23 @@ from unittest.mock import MagicMock, patch
 import pytest
 import yaml
 
+from weft.state.exceptions import InvalidTransitionError
 from weft.state.feature_state import FeatureState, FeatureStatus, StateTransition
-from weft.state.utils import get_feature_state, get_state_file, list_features_by_state
+from weft.state.utils import (
+    _runtime,
+    get_feature_state,
+    get_state_file,
+    list_features_by_state,
+)
+
+
+@pytest.fixture
+def ready_state():
+    """Feature state advanced from DRAFT through IN_PROGRESS to READY."""
+    state = FeatureState.create_initial("test-feature")
+    state.transition_to(FeatureStatus.IN_PROGRESS)
+    state.transition_to(FeatureStatus.READY)
+    return state
 
 
 class TestFeatureStatus:
@@ -57,6 +74,13 @@ class TestStateTransition:
         assert isinstance(transition.timestamp, datetime)
         assert transition.reason is None
 
+    def test_transition_is_immutable(self):
+        """Test that recorded transitions cannot be rewritten."""
+        transition = StateTransition(to_state=FeatureStatus.DRAFT)
+
+        with pytest.raises(FrozenInstanceError):
+            transition.reason = "Rewritten"  # type: ignore[misc]
+
     def test_transition_timestamp_auto_generated(self):
         """Test that timestamp is automatically generated."""
         before = datetime.now()
@@ -99,6 +123,14 @@ class TestFeatureState:
         assert state.transitions[1].reason == "Starting work"
         assert state.last_activity > original_activity
 
+    def test_transition_timestamp_matches_last_activity(self):
+        """Test that a transition and last_activity record the same instant."""
+        state = FeatureState.create_initial("test-feature")
+
+        state.transition_to(FeatureStatus.IN_PROGRESS)
+
+        assert state.transitions[-1].timestamp == state.last_activity
+
     def test_valid_transition_in_progress_to_ready(self):
         """Test valid transition from IN_PROGRESS to READY."""
         state = FeatureState.create_initial("test-feature")
@@ -109,11 +141,19 @@ class TestFeatureState:
         assert state.status == FeatureStatus.READY
         assert len(state.transitions) == 3
 
-    def test_valid_transition_ready_to_completed(self):
-        """Test valid transition from READY to COMPLETED."""
+    def test_valid_transition_in_progress_to_draft(self):
+        """Test valid backward transition from IN_PROGRESS to DRAFT."""
         state = FeatureState.create_initial("test-feature")
         state.transition_to(FeatureStatus.IN_PROGRESS)
-        state.transition_to(FeatureStatus.READY)
+
+        state.transition_to(FeatureStatus.DRAFT, "Spec needs rework")
+
+        assert state.status == FeatureStatus.DRAFT
+        assert len(state.transitions) == 3
+
+    def test_valid_transition_ready_to_completed(self, ready_state):
+        """Test valid transition from READY to COMPLETED."""
+        state = ready_state
 
         state.transition_to(FeatureStatus.COMPLETED, "Merged to main")
 
@@ -130,33 +170,27 @@ class TestFeatureState:
         assert len(state.transitions) == 2
         assert state.transitions[1].reason == "No longer needed"
 
-    def test_valid_transition_ready_to_in_progress(self):
+    def test_valid_transition_ready_to_in_progress(self, ready_state):
         """Test valid backward transition from READY to IN_PROGRESS."""
-        state = FeatureState.create_initial("test-feature")
-        state.transition_to(FeatureStatus.IN_PROGRESS)
-        state.transition_to(FeatureStatus.READY)
+        state = ready_state
 
         # Should be able to go back to IN_PROGRESS
         state.transition_to(FeatureStatus.IN_PROGRESS, "Need more work")
 
         assert state.status == FeatureStatus.IN_PROGRESS
 
-    def test_valid_transition_ready_to_merge_conflict(self):
+    def test_valid_transition_ready_to_merge_conflict(self, ready_state):
         """Test valid transition from READY to MERGE_CONFLICT."""
-        state = FeatureState.create_initial("test-feature")
-        state.transition_to(FeatureStatus.IN_PROGRESS)
-        state.transition_to(FeatureStatus.READY)
+        state = ready_state
 
         state.transition_to(FeatureStatus.MERGE_CONFLICT, "Merge failed")
 
         assert state.status == FeatureStatus.MERGE_CONFLICT
         assert len(state.transitions) == 4
 
-    def test_valid_transition_merge_conflict_to_completed(self):
+    def test_valid_transition_merge_conflict_to_completed(self, ready_state):
         """Test valid transition from MERGE_CONFLICT to COMPLETED."""
-        state = FeatureState.create_initial("test-feature")
-        state.transition_to(FeatureStatus.IN_PROGRESS)
-        state.transition_to(FeatureStatus.READY)
+        state = ready_state
         state.transition_to(FeatureStatus.MERGE_CONFLICT)
 
         # After resolving conflicts manually
@@ -164,11 +198,9 @@ class TestFeatureState:
 
         assert state.status == FeatureStatus.COMPLETED
 
-    def test_valid_transition_merge_conflict_to_ready(self):
+    def test_valid_transition_merge_conflict_to_ready(self, ready_state):
         """Test valid transition from MERGE_CONFLICT back to READY."""
-        state = FeatureState.create_initial("test-feature")
-        state.transition_to(FeatureStatus.IN_PROGRESS)
-        state.transition_to(FeatureStatus.READY)
+        state = ready_state
         state.transition_to(FeatureStatus.MERGE_CONFLICT, "Merge failed")
 
         # User wants to retry merge
@@ -176,11 +208,9 @@ class TestFeatureState:
 
         assert state.status == FeatureStatus.READY
 
-    def test_valid_transition_merge_conflict_to_dropped(self):
+    def test_valid_transition_merge_conflict_to_dropped(self, ready_state):
         """Test valid transition from MERGE_CONFLICT to DROPPED."""
-        state = FeatureState.create_initial("test-feature")
-        state.transition_to(FeatureStatus.IN_PROGRESS)
-        state.transition_to(FeatureStatus.READY)
+        state = ready_state
         state.transition_to(FeatureStatus.MERGE_CONFLICT)
 
         # Give up on the feature
@@ -210,11 +240,19 @@ class TestFeatureState:
         with pytest.raises(ValueError, match="Invalid state transition"):
             state.transition_to(FeatureStatus.COMPLETED)
 
-    def test_terminal_state_completed_no_transitions(self):
-        """Test that COMPLETED state has no valid transitions."""
+    def test_invalid_transition_error_carries_states(self):
+        """Test invalid transitions raise InvalidTransitionError with both states."""
         state = FeatureState.create_initial("test-feature")
-        state.transition_to(FeatureStatus.IN_PROGRESS)
-        state.transition_to(FeatureStatus.READY)
+
+        with pytest.raises(InvalidTransitionError) as exc_info:
+            state.transition_to(FeatureStatus.COMPLETED)
+
+        assert exc_info.value.from_state == FeatureStatus.DRAFT
+        assert exc_info.value.to_state == FeatureStatus.COMPLETED
+
+    def test_terminal_state_completed_no_transitions(self, ready_state):
+        """Test that COMPLETED state has no valid transitions."""
+        state = ready_state
         state.transition_to(FeatureStatus.COMPLETED)
 
         # Try all possible transitions - all should fail
@@ -248,156 +286,219 @@ class TestFeatureState:
         with pytest.raises(ValueError):
             state.transition_to(FeatureStatus.COMPLETED)
 
-    def test_save_and_load_state(self):
+    def test_save_and_load_state(self, tmp_path):
         """Test saving and loading state from file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state_file = Path(tmpdir) / "state.yaml"
+        state_file = tmp_path / "state.yaml"
 
-            # Create and save state
-            original_state = FeatureState.create_initial("test-feature")
-            original_state.transition_to(FeatureStatus.IN_PROGRESS, "Starting work")
-            original_state.merge_commit = "abc123"
-            original_state.save(state_file)
+        # Create and save state
+        original_state = FeatureState.create_initial("test-feature")
+        original_state.transition_to(FeatureStatus.IN_PROGRESS, "Starting work")
+        original_state.merge_commit = "abc123"
+        original_state.save(state_file)
 
-            # Load state
-            loaded_state = FeatureState.load(state_file)
+        # Load state
+        loaded_state = FeatureState.load(state_file)
 
-            # Verify loaded state matches original
-            assert loaded_state.feature_name == original_state.feature_name
-            assert loaded_state.status == original_state.status
-            assert loaded_state.merge_commit == original_state.merge_commit
-            assert len(loaded_state.transitions) == len(original_state.transitions)
+        # Verify loaded state matches original
+        assert loaded_state.feature_name == original_state.feature_name
+        assert loaded_state.status == original_state.status
+        assert loaded_state.merge_commit == original_state.merge_commit
+        assert len(loaded_state.transitions) == len(original_state.transitions)
 
-    def test_save_creates_parent_directories(self):
+    def test_save_creates_parent_directories(self, tmp_path):
         """Test that save creates parent directories if needed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state_file = Path(tmpdir) / "nested" / "dirs" / "state.yaml"
+        state_file = tmp_path / "nested" / "dirs" / "state.yaml"
 
-            state = FeatureState.create_initial("test-feature")
-            state.save(state_file)
+        state = FeatureState.create_initial("test-feature")
+        state.save(state_file)
+
+        assert state_file.exists()
+        assert state_file.parent.exists()
 
-            assert state_file.exists()
-            assert state_file.parent.exists()
+    def test_save_overwrites_without_leaving_temp_files(self, tmp_path):
+        """Test that repeated saves replace the file and clean up temp files."""
+        state_file = tmp_path / "state.yaml"
+        state = FeatureState.create_initial("test-feature")
+        state.save(state_file)
+
+        state.transition_to(FeatureStatus.IN_PROGRESS)
+        state.save(state_file)
 
-    def test_load_nonexistent_file_raises_error(self):
+        assert [p.name for p in tmp_path.iterdir()] == ["state.yaml"]
+        assert FeatureState.load(state_file).status == FeatureStatus.IN_PROGRESS
+
+    def test_save_follows_umask(self, tmp_path):
+        """Test that saved state files get umask-based permissions, not 0600."""
+        state_file = tmp_path / "state.yaml"
+        old_umask = os.umask(0o022)
+        try:
+            FeatureState.create_initial("test-feature").save(state_file)
+        finally:
+            os.umask(old_umask)
+
+        assert stat.S_IMODE(state_file.stat().st_mode) == 0o644
+
+    def test_load_nonexistent_file_raises_error(self, tmp_path):
         """Test that loading nonexistent file raises FileNotFoundError."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state_file = Path(tmpdir) / "nonexistent.yaml"
+        state_file = tmp_path / "nonexistent.yaml"
 
-            with pytest.raises(FileNotFoundError):
-                FeatureState.load(state_file)
+        with pytest.raises(FileNotFoundError):
+            FeatureState.load(state_file)
 
-    def test_save_produces_valid_yaml(self):
+    def test_save_produces_valid_yaml(self, tmp_path):
         """Test that saved state is valid YAML."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state_file = Path(tmpdir) / "state.yaml"
+        state_file = tmp_path / "state.yaml"
 
-            state = FeatureState.create_initial("test-feature")
-            state.transition_to(FeatureStatus.IN_PROGRESS)
-            state.save(state_file)
+        state = FeatureState.create_initial("test-feature")
+        state.transition_to(FeatureStatus.IN_PROGRESS)
+        state.save(state_file)
+
+        # Load as raw YAML
+        data = yaml.safe_load(state_file.read_bytes())
+
+        assert data["feature_name"] == "test-feature"
+        assert data["status"] == "in-progress"
+        assert "created_at" in data
+        assert "last_activity" in data
+        assert len(data["transitions"]) == 2
+
+    def test_load_if_status_matches(self, tmp_path):
+        """Test load_if_status returns the state only when status matches."""
+        state_file = tmp_path / "state.yaml"
+        state = FeatureState.create_initial("test-feature")
+        state.transition_to(FeatureStatus.IN_PROGRESS)
+        state.save(state_file)
+
+        loaded = FeatureState.load_if_status(state_file, FeatureStatus.IN_PROGRESS)
+        skipped = FeatureState.load_if_status(state_file, FeatureStatus.DRAFT)
+
+        assert loaded is not None
+        assert loaded.feature_name == "test-feature"
+        assert len(loaded.transitions) == 2
+        assert skipped is None
+
+    def test_load_legacy_yaml_state(self, tmp_path):
+        """Test that state files written in the old YAML layout still load."""
+        state_file = tmp_path / "state.yaml"
+        state_file.write_text(
+            "feature_name: legacy-feature\n"
+            "status: in-progress\n"
+            "created_at: '2025-01-01T12:00:00'\n"
+            "last_activity: '2025-01-02T12:00:00'\n"
+            "transitions:\n"
+            "- from_state: null\n"
+            "  to_state: draft\n"
+            "  timestamp: '2025-01-01T12:00:00'\n"
+            "  reason: Feature created\n"
+            "- from_state: draft\n"
+            "  to_state: in-progress\n"
+            "  timestamp: '2025-01-02T12:00:00'\n"
+            "  reason: null\n"
+            "merge_commit: null\n"
+            "merge_error: null\n"
+            "drop_reason: null\n"
+        )
 
-            # Load as raw YAML
-            with open(state_file) as f:
-                data = yaml.safe_load(f)
+        state = FeatureState.load(state_file)
 
-            assert data["feature_name"] == "test-feature"
-            assert data["status"] == "in-progress"
-            assert "created_at" in data
-            assert "last_activity" in data
-            assert len(data["transitions"]) == 2
+        assert state.feature_name == "legacy-feature"
+        assert state.status == FeatureStatus.IN_PROGRESS
+        assert state.created_at == datetime(2025, 1, 1, 12, 0, 0)
+        assert state.transitions[1].from_state == FeatureStatus.DRAFT
 
-    def test_timestamps_preserved_through_save_load(self):
+    def test_timestamps_preserved_through_save_load(self, tmp_path):
         """Test that timestamps are preserved through save/load cycle."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state_file = Path(tmpdir) / "state.yaml"
-
-            # Create state with specific timestamp
-            original_time = datetime(2025, 1, 1, 12, 0, 0)
-            state = FeatureState(
-                feature_name="test-feature",
-                status=FeatureStatus.DRAFT,
-                created_at=original_time,
-                last_activity=original_time,
-                transitions=[],
-            )
-            state.save(state_file)
+        state_file = tmp_path / "state.yaml"
+
+        # Create state with specific timestamp
+        original_time = datetime(2025, 1, 1, 12, 0, 0)
+        state = FeatureState(
+            feature_name="test-feature",
+            status=FeatureStatus.DRAFT,
+            created_at=original_time,
+            last_activity=original_time,
+            transitions=[],
+        )
+        state.save(state_file)
 
-            # Load and verify
-            loaded_state = FeatureState.load(state_file)
-            assert loaded_state.created_at == original_time
-            assert loaded_state.last_activity == original_time
+        # Load and verify
+        loaded_state = FeatureState.load(state_file)
+        assert loaded_state.created_at == original_time
+        assert loaded_state.last_activity == original_time
 
-    def test_transition_history_preserved(self):
+    def test_transition_history_preserved(self, tmp_path):
         """Test that complete transition history is preserved."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state_file = Path(tmpdir) / "state.yaml"
-
-            # Create state with multiple transitions
-            state = FeatureState.create_initial("test-feature")
-            state.transition_to(FeatureStatus.IN_PROGRESS, "Start work")
-            state.transition_to(FeatureStatus.READY, "Work done")
-            state.transition_to(FeatureStatus.IN_PROGRESS, "Need fixes")
-            state.transition_to(FeatureStatus.READY, "Fixes done")
-            state.save(state_file)
+        state_file = tmp_path / "state.yaml"
 
-            # Load and verify
-            loaded_state = FeatureState.load(state_file)
-            assert len(loaded_state.transitions) == 5
-            assert loaded_state.transitions[0].to_state == FeatureStatus.DRAFT
-            assert loaded_state.transitions[1].to_state == FeatureStatus.IN_PROGRESS
-            assert loaded_state.transitions[2].to_state == FeatureStatus.READY
-            assert loaded_state.transitions[3].to_state == FeatureStatus.IN_PROGRESS
-            assert loaded_state.transitions[4].to_state == FeatureStatus.READY
-
-    def test_merge_commit_and_drop_reason_preserved(self):
+        # Create state with multiple transitions
+        state = FeatureState.create_initial("test-feature")
+        state.transition_to(FeatureStatus.IN_PROGRESS, "Start work")
+        state.transition_to(FeatureStatus.READY, "Work done")
+        state.transition_to(FeatureStatus.IN_PROGRESS, "Need fixes")
+        state.transition_to(FeatureStatus.READY, "Fixes done")
+        state.save(state_file)
+
+        # Load and verify
+        loaded_state = FeatureState.load(state_file)
+        assert len(loaded_state.transitions) == 5
+        assert loaded_state.transitions[0].to_state == FeatureStatus.DRAFT
+        assert loaded_state.transitions[1].to_state == FeatureStatus.IN_PROGRESS
+        assert loaded_state.transitions[2].to_state == FeatureStatus.READY
+        assert loaded_state.transitions[3].to_state == FeatureStatus.IN_PROGRESS
+        assert loaded_state.transitions[4].to_state == FeatureStatus.READY
+
+    def test_merge_commit_and_drop_reason_preserved(self, tmp_path):
         """Test that merge_commit and drop_reason are preserved."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state_file = Path(tmpdir) / "state.yaml"
+        state_file = tmp_path / "state.yaml"
 
-            # Test with merge_commit
-            state = FeatureState.create_initial("completed-feature")
-            state.transition_to(FeatureStatus.IN_PROGRESS)
-            state.transition_to(FeatureStatus.READY)
-            state.transition_to(FeatureStatus.COMPLETED)
-            state.merge_commit = "abc123def456"
-            state.save(state_file)
+        # Test with merge_commit
+        state = FeatureState.create_initial("completed-feature")
+        state.transition_to(FeatureStatus.IN_PROGRESS)
+        state.transition_to(FeatureStatus.READY)
+        state.transition_to(FeatureStatus.COMPLETED)
+        state.merge_commit = "abc123def456"
+        state.save(state_file)
 
-            loaded_state = FeatureState.load(state_file)
-            assert loaded_state.merge_commit == "abc123def456"
+        loaded_state = FeatureState.load(state_file)
+        assert loaded_state.merge_commit == "abc123def456"
 
-            # Test with drop_reason
-            state2_file = Path(tmpdir) / "state2.yaml"
-            state2 = FeatureState.create_initial("dropped-feature")
-            state2.transition_to(FeatureStatus.DROPPED)
-            state2.drop_reason = "Obsolete requirement"
-            state2.save(state2_file)
+        # Test with drop_reason
+        state2_file = tmp_path / "state2.yaml"
+        state2 = FeatureState.create_initial("dropped-feature")
+        state2.transition_to(FeatureStatus.DROPPED)
+        state2.drop_reason = "Obsolete requirement"
+        state2.save(state2_file)
 
-            loaded_state2 = FeatureState.load(state2_file)
-            assert loaded_state2.drop_reason == "Obsolete requirement"
+        loaded_state2 = FeatureState.load(state2_file)
+        assert loaded_state2.drop_reason == "Obsolete requirement"
 
-    def test_merge_error_preserved(self):
+    def test_merge_error_preserved(self, tmp_path):
         """Test that merge_error is preserved through save/load."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state_file = Path(tmpdir) / "state.yaml"
+        state_file = tmp_path / "state.yaml"
 
-            # Create state with merge conflict
-            state = FeatureState.create_initial("conflict-feature")
-            state.transition_to(FeatureStatus.IN_PROGRESS)
-            state.transition_to(FeatureStatus.READY)
-            state.transition_to(FeatureStatus.MERGE_CONFLICT)
-            state.merge_error = "error: The following untracked working tree files..."
-            state.save(state_file)
+        # Create state with merge conflict
+        state = FeatureState.create_initial("conflict-feature")
+        state.transition_to(FeatureStatus.IN_PROGRESS)
+        state.transition_to(FeatureStatus.READY)
+        state.transition_to(FeatureStatus.MERGE_CONFLICT)
+        state.merge_error = "error: The following untracked working tree files..."
+        state.save(state_file)
 
-            loaded_state = FeatureState.load(state_file)
-            assert (
-                loaded_state.merge_error == "error: The following untracked working tree files..."
-            )
-            assert loaded_state.status == FeatureStatus.MERGE_CONFLICT
+        loaded_state = FeatureState.load(state_file)
+        assert loaded_state.merge_error == "error: The following untracked working tree files..."
+        assert loaded_state.status == FeatureStatus.MERGE_CONFLICT
 
 
 class TestStateUtils:
     """Tests for state utility functions."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_runtime_cache(self):
+        """Drop the memoized runtime so each test sees its patched WeftRuntime."""
+        _runtime.cache_clear()
+        yield
+        _runtime.cache_clear()
+
     @patch("weft.state.utils.WeftRuntime")
     def test_get_state_file(self, mock_runtime_class):
         """Test getting state file path."""
@@ -410,280 +511,304 @@ class TestStateUtils:
         assert state_file == Path("/mock/.weft/features/test-feature/state.yaml")
 
     @patch("weft.state.utils.WeftRuntime")
-    def test_get_feature_state_existing(self, mock_runtime_class):
+    def test_get_feature_state_existing(self, mock_runtime_class, tmp_path):
         """Test getting existing feature state."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Setup mock runtime
-            mock_runtime = MagicMock()
-            mock_runtime.base_dir = Path(tmpdir)
-            mock_runtime_class.return_value = mock_runtime
+        # Setup mock runtime
+        mock_runtime = MagicMock()
+        mock_runtime.base_dir = tmp_path
+        mock_runtime_class.return_value = mock_runtime
 
-            # Create existing state
-            state_file = Path(tmpdir) / "features" / "test-feature" / "state.yaml"
-            state_file.parent.mkdir(parents=True)
-            original_state = FeatureState.create_initial("test-feature")
-            original_state.transition_to(FeatureStatus.IN_PROGRESS)
-            original_state.save(state_file)
+        # Create existing state
+        state_file = tmp_path / "features" / "test-feature" / "state.yaml"
+        state_file.parent.mkdir(parents=True)
+        original_state = FeatureState.create_initial("test-feature")
+        original_state.transition_to(FeatureStatus.IN_PROGRESS)
+        original_state.save(state_file)
 
-            # Get state
-            loaded_state = get_feature_state("test-feature")
+        # Get state
+        loaded_state = get_feature_state("test-feature")
 
-            assert loaded_state.feature_name == "test-feature"
-            assert loaded_state.status == FeatureStatus.IN_PROGRESS
+        assert loaded_state.feature_name == "test-feature"
+        assert loaded_state.status == FeatureStatus.IN_PROGRESS
 
     @patch("weft.state.utils.WeftRuntime")
-    def test_get_feature_state_creates_if_missing(self, mock_runtime_class):
+    def test_get_feature_state_creates_if_missing(self, mock_runtime_class, tmp_path):
         """Test that get_feature_state creates state if it doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Setup mock runtime
-            mock_runtime = MagicMock()
-            mock_runtime.base_dir = Path(tmpdir)
-            mock_runtime_class.return_value = mock_runtime
+        # Setup mock runtime
+        mock_runtime = MagicMock()
+        mock_runtime.base_dir = tmp_path
+        mock_runtime_class.return_value = mock_runtime
 
-            # Get state (doesn't exist yet)
-            state = get_feature_state("new-feature")
+        # Get state (doesn't exist yet)
+        state = get_feature_state("new-feature")
 
-            # Verify state was created
-            assert state.feature_name == "new-feature"
-            assert state.status == FeatureStatus.DRAFT
+        # Verify state was created
+        assert state.feature_name == "new-feature"
+        assert state.status == FeatureStatus.DRAFT
 
-            # Verify state file was created
-            state_file = Path(tmpdir) / "features" / "new-feature" / "state.yaml"
-            assert state_file.exists()
+        # Verify state file was created
+        state_file = tmp_path / "features" / "new-feature" / "state.yaml"
+        assert state_file.exists()
 
     @patch("weft.state.utils.WeftRuntime")
-    def test_list_features_by_state_all(self, mock_runtime_class):
+    def test_list_features_by_state_all(self, mock_runtime_class, tmp_path):
         """Test listing all features."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Setup mock runtime
-            mock_runtime = MagicMock()
-            mock_runtime.base_dir = Path(tmpdir)
-            mock_runtime_class.return_value = mock_runtime
-
-            features_dir = Path(tmpdir) / "features"
-            features_dir.mkdir()
-
-            # Create multiple features with different states
-            for name, status in [
-                ("feature-1", FeatureStatus.DRAFT),
-                ("feature-2", FeatureStatus.IN_PROGRESS),
-                ("feature-3", FeatureStatus.READY),
-            ]:
-                state_file = features_dir / name / "state.yaml"
-                state_file.parent.mkdir()
-                state = FeatureState.create_initial(name)
-                if status == FeatureStatus.IN_PROGRESS:
-                    state.transition_to(FeatureStatus.IN_PROGRESS)
-                elif status == FeatureStatus.READY:
-                    state.transition_to(FeatureStatus.IN_PROGRESS)
-                    state.transition_to(FeatureStatus.READY)
-                state.save(state_file)
-
-            # List all features
-            states = list_features_by_state()
-
-            assert len(states) == 3
-            names = {s.feature_name for s in states}
-            assert names == {"feature-1", "feature-2", "feature-3"}
+        # Setup mock runtime
+        mock_runtime = MagicMock()
+        mock_runtime.base_dir = tmp_path
+        mock_runtime_class.return_value = mock_runtime
+
+        features_dir = tmp_path / "features"
+        features_dir.mkdir()
+
+        # Create multiple features with different states
+        for name, status in [
+            ("feature-1", FeatureStatus.DRAFT),
+            ("feature-2", FeatureStatus.IN_PROGRESS),
+            ("feature-3", FeatureStatus.READY),
+        ]:
+            state_file = features_dir / name / "state.yaml"
+            state_file.parent.mkdir()
+            state = FeatureState.create_initial(name)
+            if status == FeatureStatus.IN_PROGRESS:
+                state.transition_to(FeatureStatus.IN_PROGRESS)
+            elif status == FeatureStatus.READY:
+                state.transition_to(FeatureStatus.IN_PROGRESS)
+                state.transition_to(FeatureStatus.READY)
+            state.save(state_file)
+
+        # List all features
+        states = list_features_by_state()
+
+        assert len(states) == 3
+        names = {s.feature_name for s in states}
+        assert names == {"feature-1", "feature-2", "feature-3"}
 
     @patch("weft.state.utils.WeftRuntime")
-    def test_list_features_by_state_filtered(self, mock_runtime_class):
+    def test_list_features_by_state_filtered(self, mock_runtime_class, tmp_path):
         """Test listing features filtered by status."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Setup mock runtime
-            mock_runtime = MagicMock()
-            mock_runtime.base_dir = Path(tmpdir)
-            mock_runtime_class.return_value = mock_runtime
-
-            features_dir = Path(tmpdir) / "features"
-            features_dir.mkdir()
-
-            # Create multiple features with different states
-            for name, status in [
-                ("draft-1", FeatureStatus.DRAFT),
-                ("draft-2", FeatureStatus.DRAFT),
-                ("in-progress-1", FeatureStatus.IN_PROGRESS),
-                ("ready-1", FeatureStatus.READY),
-            ]:
-                state_file = features_dir / name / "state.yaml"
-                state_file.parent.mkdir()
-                state = FeatureState.create_initial(name)
-                if status == FeatureStatus.IN_PROGRESS:
-                    state.transition_to(FeatureStatus.IN_PROGRESS)
-                elif status == FeatureStatus.READY:
-                    state.transition_to(FeatureStatus.IN_PROGRESS)
-                    state.transition_to(FeatureStatus.READY)
-                state.save(state_file)
-
-            # List only DRAFT features
-            draft_states = list_features_by_state(FeatureStatus.DRAFT)
-            assert len(draft_states) == 2
-            names = {s.feature_name for s in draft_states}
-            assert names == {"draft-1", "draft-2"}
-
-            # List only IN_PROGRESS features
-            in_progress_states = list_features_by_state(FeatureStatus.IN_PROGRESS)
-            assert len(in_progress_states) == 1
-            assert in_progress_states[0].feature_name == "in-progress-1"
+        # Setup mock runtime
+        mock_runtime = MagicMock()
+        mock_runtime.base_dir = tmp_path
+        mock_runtime_class.return_value = mock_runtime
+
+        features_dir = tmp_path / "features"
+        features_dir.mkdir()
+
+        # Create multiple features with different states
+        for name, status in [
+            ("draft-1", FeatureStatus.DRAFT),
+            ("draft-2", FeatureStatus.DRAFT),
+            ("in-progress-1", FeatureStatus.IN_PROGRESS),
+            ("ready-1", FeatureStatus.READY),
+        ]:
+            state_file = features_dir / name / "state.yaml"
+            state_file.parent.mkdir()
+            state = FeatureState.create_initial(name)
+            if status == FeatureStatus.IN_PROGRESS:
+                state.transition_to(FeatureStatus.IN_PROGRESS)
+            elif status == FeatureStatus.READY:
+                state.transition_to(FeatureStatus.IN_PROGRESS)
+                state.transition_to(FeatureStatus.READY)
+            state.save(state_file)
+
+        # List only DRAFT features
+        draft_states = list_features_by_state(FeatureStatus.DRAFT)
+        assert len(draft_states) == 2
+        names = {s.feature_name for s in draft_states}
+        assert names == {"draft-1", "draft-2"}
+
+        # List only IN_PROGRESS features
+        in_progress_states = list_features_by_state(FeatureStatus.IN_PROGRESS)
+        assert len(in_progress_states) == 1
+        assert in_progress_states[0].feature_name == "in-progress-1"
 
     @patch("weft.state.utils.WeftRuntime")
-    def test_list_features_empty_directory(self, mock_runtime_class):
+    def test_list_features_by_state_many_features(self, mock_runtime_class, tmp_path):
+        """Test listing enough features to load them on worker threads."""
+        mock_runtime = MagicMock()
+        mock_runtime.base_dir = tmp_path
+        mock_runtime_class.return_value = mock_runtime
+
+        features_dir = tmp_path / "features"
+        for i in range(12):
+            state = FeatureState.create_initial(f"feature-{i}")
+            if i % 2:
+                state.transition_to(FeatureStatus.IN_PROGRESS)
+            state.save(features_dir / f"feature-{i}" / "state.yaml")
+        (features_dir / "broken").mkdir()
+        (features_dir / "broken" / "state.yaml").write_bytes(b"[[[")
+
+        assert len(list_features_by_state()) == 12
+        in_progress = list_features_by_state(FeatureStatus.IN_PROGRESS)
+        assert {s.feature_name for s in in_progress} == {f"feature-{i}" for i in range(1, 12, 2)}
+
+    @patch("weft.state.utils.WeftRuntime")
+    def test_list_features_empty_directory(self, mock_runtime_class, tmp_path):
         """Test listing features when directory doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Setup mock runtime with non-existent features dir
-            mock_runtime = MagicMock()
-            mock_runtime.base_dir = Path(tmpdir)
-            mock_runtime_class.return_value = mock_runtime
+        # Setup mock runtime with non-existent features dir
+        mock_runtime = MagicMock()
+        mock_runtime.base_dir = tmp_path
+        mock_runtime_class.return_value = mock_runtime
 
-            states = list_features_by_state()
+        states = list_features_by_state()
 
-            assert states == []
+        assert states == []
 
     @patch("weft.state.utils.WeftRuntime")
-    def test_list_features_skips_invalid_states(self, mock_runtime_class):
+    def test_list_features_skips_invalid_states(self, mock_runtime_class, tmp_path):
         """Test that list_features_by_state skips invalid state files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Setup mock runtime
-            mock_runtime = MagicMock()
-            mock_runtime.base_dir = Path(tmpdir)
-            mock_runtime_class.return_value = mock_runtime
-
-            features_dir = Path(tmpdir) / "features"
-            features_dir.mkdir()
-
-            # Create valid state
-            valid_dir = features_dir / "valid-feature"
-            valid_dir.mkdir()
-            valid_state = FeatureState.create_initial("valid-feature")
-            valid_state.save(valid_dir / "state.yaml")
-
-            # Create invalid state (bad YAML)
-            invalid_dir = features_dir / "invalid-feature"
-            invalid_dir.mkdir()
-            with open(invalid_dir / "state.yaml", "w") as f:
-                f.write("invalid: yaml: content: [[[")
-
-            # List should only return valid feature
-            states = list_features_by_state()
-            assert len(states) == 1
-            assert states[0].feature_name == "valid-feature"
+        # Setup mock runtime
+        mock_runtime = MagicMock()
+        mock_runtime.base_dir = tmp_path
+        mock_runtime_class.return_value = mock_runtime
+
+        features_dir = tmp_path / "features"
+        features_dir.mkdir()
+
+        # Create valid state
+        valid_dir = features_dir / "valid-feature"
+        valid_dir.mkdir()
+        valid_state = FeatureState.create_initial("valid-feature")
+        valid_state.save(valid_dir / "state.yaml")
+
+        # Create invalid state (bad YAML)
+        invalid_dir = features_dir / "invalid-feature"
+        invalid_dir.mkdir()
+        (invalid_dir / "state.yaml").write_bytes(b"invalid: yaml: content: [[[")
+
+        # List should only return valid feature
+        states = list_features_by_state()
+        assert len(states) == 1
+        assert states[0].feature_name == "valid-feature"
 
     @patch("weft.state.utils.WeftRuntime")
-    def test_list_features_skips_non_directories(self, mock_runtime_class):
+    def test_list_features_skips_non_directories(self, mock_runtime_class, tmp_path):
         """Test that list_features_by_state skips non-directory items."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Setup mock runtime
-            mock_runtime = MagicMock()
-            mock_runtime.base_dir = Path(tmpdir)
-            mock_runtime_class.return_value = mock_runtime
+        # Setup mock runtime
+        mock_runtime = MagicMock()
+        mock_runtime.base_dir = tmp_path
+        mock_runtime_class.return_value = mock_runtime
+
+        features_dir = tmp_path / "features"
+        features_dir.mkdir()
+
+        # Create valid feature
+        feature_dir = features_dir / "feature-1"
+        feature_dir.mkdir()
+        state = FeatureState.create_initial("feature-1")
+        state.save(feature_dir / "state.yaml")
+
+        # Create a regular file (not directory)
+        (features_dir / "some-file.txt").write_text("not a feature")
+
+        # List should only return the feature directory
+        states = list_features_by_state()
+        assert len(states) == 1
+        assert states[0].feature_name == "feature-1"
 
-            features_dir = Path(tmpdir) / "features"
-            features_dir.mkdir()
+    @patch("weft.state.utils.WeftRuntime")
+    def test_list_features_skips_directories_without_state(self, mock_runtime_class, tmp_path):
+        """Test that feature directories lacking state.yaml are ignored."""
+        mock_runtime = MagicMock()
+        mock_runtime.base_dir = tmp_path
+        mock_runtime_class.return_value = mock_runtime
 
-            # Create valid feature
-            feature_dir = features_dir / "feature-1"
-            feature_dir.mkdir()
-            state = FeatureState.create_initial("feature-1")
-            state.save(feature_dir / "state.yaml")
+        features_dir = tmp_path / "features"
+        (features_dir / "no-state").mkdir(parents=True)
+        FeatureState.create_initial("feature-1").save(features_dir / "feature-1" / "state.yaml")
 
-            # Create a regular file (not directory)
-            (features_dir / "some-file.txt").write_text("not a feature")
+        states = list_features_by_state()
 
-            # List should only return the feature directory
-            states = list_features_by_state()
-            assert len(states) == 1
-            assert states[0].feature_name == "feature-1"
+        assert [s.feature_name for s in states] == ["feature-1"]
 
 
 class TestFeatureLifecycle:
     """Integration tests for complete feature lifecycle."""
 
-    def test_complete_lifecycle_draft_to_completed(self):
+    def test_complete_lifecycle_draft_to_completed(self, tmp_path):
         """Test complete lifecycle: DRAFT → IN_PROGRESS → READY → COMPLETED."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state_file = Path(tmpdir) / "state.yaml"
+        state_file = tmp_path / "state.yaml"
 
-            # 1. Create feature (DRAFT)
-            state = FeatureState.create_initial("test-feature")
-            assert state.status == FeatureStatus.DRAFT
-            state.save(state_file)
+        # 1. Create feature (DRAFT)
+        state = FeatureState.create_initial("test-feature")
+        assert state.status == FeatureStatus.DRAFT
+        state.save(state_file)
 
-            # 2. Start work (IN_PROGRESS)
-            state = FeatureState.load(state_file)
-            state.transition_to(FeatureStatus.IN_PROGRESS, "Spec approved")
-            assert state.status == FeatureStatus.IN_PROGRESS
-            state.save(state_file)
+        # 2. Start work (IN_PROGRESS)
+        state = FeatureState.load(state_file)
+        state.transition_to(FeatureStatus.IN_PROGRESS, "Spec approved")
+        assert state.status == FeatureStatus.IN_PROGRESS
+        state.save(state_file)
 
-            # 3. Complete agents (READY)
-            state = FeatureState.load(state_file)
-            state.transition_to(FeatureStatus.READY, "All agents done")
-            assert state.status == FeatureStatus.READY
-            state.save(state_file)
+        # 3. Complete agents (READY)
+        state = FeatureState.load(state_file)
+        state.transition_to(FeatureStatus.READY, "All agents done")
+        assert state.status == FeatureStatus.READY
+        state.save(state_file)
 
-            # 4. Merge (COMPLETED)
-            state = FeatureState.load(state_file)
-            state.merge_commit = "abc123"
-            state.transition_to(FeatureStatus.COMPLETED, "Merged to main")
-            assert state.status == FeatureStatus.COMPLETED
-            state.save(state_file)
+        # 4. Merge (COMPLETED)
+        state = FeatureState.load(state_file)
+        state.merge_commit = "abc123"
+        state.transition_to(FeatureStatus.COMPLETED, "Merged to main")
+        assert state.status == FeatureStatus.COMPLETED
+        state.save(state_file)
 
-            # Verify final state
-            final_state = FeatureState.load(state_file)
-            assert final_state.status == FeatureStatus.COMPLETED
-            assert final_state.merge_commit == "abc123"
-            assert len(final_state.transitions) == 4
+        # Verify final state
+        final_state = FeatureState.load(state_file)
+        assert final_state.status == FeatureStatus.COMPLETED
+        assert final_state.merge_commit == "abc123"
+        assert len(final_state.transitions) == 4
 
-    def test_complete_lifecycle_draft_to_dropped(self):
+    def test_complete_lifecycle_draft_to_dropped(self, tmp_path):
         """Test lifecycle ending in drop: DRAFT → DROPPED."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state_file = Path(tmpdir) / "state.yaml"
+        state_file = tmp_path / "state.yaml"
 
-            # 1. Create feature (DRAFT)
-            state = FeatureState.create_initial("bad-feature")
-            state.save(state_file)
+        # 1. Create feature (DRAFT)
+        state = FeatureState.create_initial("bad-feature")
+        state.save(state_file)
 
-            # 2. Drop immediately (DROPPED)
-            state = FeatureState.load(state_file)
-            state.drop_reason = "Obsolete requirement"
-            state.transition_to(FeatureStatus.DROPPED, "No longer needed")
-            state.save(state_file)
+        # 2. Drop immediately (DROPPED)
+        state = FeatureState.load(state_file)
+        state.drop_reason = "Obsolete requirement"
+        state.transition_to(FeatureStatus.DROPPED, "No longer needed")
+        state.save(state_file)
 
-            # Verify final state
-            final_state = FeatureState.load(state_file)
-            assert final_state.status == FeatureStatus.DROPPED
-            assert final_state.drop_reason == "Obsolete requirement"
-            assert len(final_state.transitions) == 2
+        # Verify final state
+        final_state = FeatureState.load(state_file)
+        assert final_state.status == FeatureStatus.DROPPED
+        assert final_state.drop_reason == "Obsolete requirement"
+        assert len(final_state.transitions) == 2
 
-    def test_lifecycle_with_iteration(self):
+    def test_lifecycle_with_iteration(self, tmp_path):
         """Test lifecycle with iteration back to IN_PROGRESS."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state_file = Path(tmpdir) / "state.yaml"
+        state_file = tmp_path / "state.yaml"
 
-            # Create and advance to READY
-            state = FeatureState.create_initial("iterative-feature")
-            state.transition_to(FeatureStatus.IN_PROGRESS)
-            state.transition_to(FeatureStatus.READY)
-            state.save(state_file)
+        # Create and advance to READY
+        state = FeatureState.create_initial("iterative-feature")
+        state.transition_to(FeatureStatus.IN_PROGRESS)
+        state.transition_to(FeatureStatus.READY)
+        state.save(state_file)
 
-            # Go back to IN_PROGRESS
-            state = FeatureState.load(state_file)
-            state.transition_to(FeatureStatus.IN_PROGRESS, "Found issues")
-            state.save(state_file)
+        # Go back to IN_PROGRESS
+        state = FeatureState.load(state_file)
+        state.transition_to(FeatureStatus.IN_PROGRESS, "Found issues")
+        state.save(state_file)
 
-            # Back to READY
-            state = FeatureState.load(state_file)
-            state.transition_to(FeatureStatus.READY, "Issues fixed")
-            state.save(state_file)
+        # Back to READY
+        state = FeatureState.load(state_file)
+        state.transition_to(FeatureStatus.READY, "Issues fixed")
+        state.save(state_file)
 
-            # Complete
-            state = FeatureState.load(state_file)
-            state.transition_to(FeatureStatus.COMPLETED)
-            state.save(state_file)
+        # Complete
+        state = FeatureState.load(state_file)
+        state.transition_to(FeatureStatus.COMPLETED)
+        state.save(state_file)
 
-            # Verify transition history
-            final_state = FeatureState.load(state_file)
-            assert len(final_state.transitions) == 6
-            # DRAFT → IN_PROGRESS → READY → IN_PROGRESS → READY → COMPLETED
+        # Verify transition history
+        final_state = FeatureState.load(state_file)
+        assert len(final_state.transitions) == 6
+        # DRAFT → IN_PROGRESS → READY → IN_PROGRESS → READY → COMPLETED
 
     def test_idempotent_transition(self):
         """Test that transitioning to the same state is idempotent."""
@@ -715,74 +840,72 @@ class TestFeatureLifecycle:
         assert state.status == FeatureStatus.DROPPED
         assert len(state.transitions) == transitions_before
 
-    def test_lifecycle_with_merge_conflict_then_retry(self):
+    def test_lifecycle_with_merge_conflict_then_retry(self, tmp_path):
         """Test lifecycle: READY → MERGE_CONFLICT → READY → COMPLETED."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state_file = Path(tmpdir) / "state.yaml"
+        state_file = tmp_path / "state.yaml"
 
-            # 1. Create and advance to READY
-            state = FeatureState.create_initial("conflict-feature")
-            state.transition_to(FeatureStatus.IN_PROGRESS, "Spec approved")
-            state.transition_to(FeatureStatus.READY, "All agents done")
-            state.save(state_file)
-
-            # 2. Try to merge - fails with conflict
-            state = FeatureState.load(state_file)
-            state.merge_error = "error: untracked files would be overwritten"
-            state.transition_to(FeatureStatus.MERGE_CONFLICT, "Merge failed")
-            state.save(state_file)
-
-            # 3. User resolves conflicts manually, retry merge
-            state = FeatureState.load(state_file)
-            assert state.status == FeatureStatus.MERGE_CONFLICT
-            assert state.merge_error is not None
-
-            # Clear error and go back to ready
-            state.merge_error = None
-            state.transition_to(FeatureStatus.READY, "Conflicts resolved")
-            state.save(state_file)
-
-            # 4. Retry merge - succeeds this time
-            state = FeatureState.load(state_file)
-            state.merge_commit = "abc123"
-            state.transition_to(FeatureStatus.COMPLETED, "Merged successfully")
-            state.save(state_file)
+        # 1. Create and advance to READY
+        state = FeatureState.create_initial("conflict-feature")
+        state.transition_to(FeatureStatus.IN_PROGRESS, "Spec approved")
+        state.transition_to(FeatureStatus.READY, "All agents done")
+        state.save(state_file)
 
-            # Verify final state
-            final_state = FeatureState.load(state_file)
-            assert final_state.status == FeatureStatus.COMPLETED
-            assert final_state.merge_commit == "abc123"
-            assert final_state.merge_error is None
-            # DRAFT → IN_PROGRESS → READY → MERGE_CONFLICT → READY → COMPLETED
-            assert len(final_state.transitions) == 6
+        # 2. Try to merge - fails with conflict
+        state = FeatureState.load(state_file)
+        state.merge_error = "error: untracked files would be overwritten"
+        state.transition_to(FeatureStatus.MERGE_CONFLICT, "Merge failed")
+        state.save(state_file)
 
-    def test_lifecycle_with_merge_conflict_then_drop(self):
+        # 3. User resolves conflicts manually, retry merge
+        state = FeatureState.load(state_file)
+        assert state.status == FeatureStatus.MERGE_CONFLICT
+        assert state.merge_error is not None
+
+        # Clear error and go back to ready
+        state.merge_error = None
+        state.transition_to(FeatureStatus.READY, "Conflicts resolved")
+        state.save(state_file)
+
+        # 4. Retry merge - succeeds this time
+        state = FeatureState.load(state_file)
+        state.merge_commit = "abc123"
+        state.transition_to(FeatureStatus.COMPLETED, "Merged successfully")
+        state.save(state_file)
+
+        # Verify final state
+        final_state = FeatureState.load(state_file)
+        assert final_state.status == FeatureStatus.COMPLETED
+        assert final_state.merge_commit == "abc123"
+        assert final_state.merge_error is None
+        # DRAFT → IN_PROGRESS → READY → MERGE_CONFLICT → READY → COMPLETED
+        assert len(final_state.transitions) == 6
+
+    def test_lifecycle_with_merge_conflict_then_drop(self, tmp_path):
         """Test lifecycle: READY → MERGE_CONFLICT → DROPPED."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state_file = Path(tmpdir) / "state.yaml"
+        state_file = tmp_path / "state.yaml"
 
-            # 1. Create and advance to READY
-            state = FeatureState.create_initial("bad-conflict-feature")
-            state.transition_to(FeatureStatus.IN_PROGRESS)
-            state.transition_to(FeatureStatus.READY)
-            state.save(state_file)
-
-            # 2. Try to merge - fails with conflict
-            state = FeatureState.load(state_file)
-            state.merge_error = "error: too many conflicts"
-            state.transition_to(FeatureStatus.MERGE_CONFLICT, "Merge failed")
-            state.save(state_file)
-
-            # 3. User decides conflicts are too hard, drops feature
-            state = FeatureState.load(state_file)
-            state.drop_reason = "Conflicts too complex to resolve"
-            state.transition_to(FeatureStatus.DROPPED, "Giving up")
-            state.save(state_file)
+        # 1. Create and advance to READY
+        state = FeatureState.create_initial("bad-conflict-feature")
+        state.transition_to(FeatureStatus.IN_PROGRESS)
+        state.transition_to(FeatureStatus.READY)
+        state.save(state_file)
 
-            # Verify final state
-            final_state = FeatureState.load(state_file)
-            assert final_state.status == FeatureStatus.DROPPED
-            assert final_state.drop_reason == "Conflicts too complex to resolve"
-            assert final_state.merge_error == "error: too many conflicts"
-            # DRAFT → IN_PROGRESS → READY → MERGE_CONFLICT → DROPPED
-            assert len(final_state.transitions) == 5
+        # 2. Try to merge - fails with conflict
+        state = FeatureState.load(state_file)
+        state.merge_error = "error: too many conflicts"
+        state.transition_to(FeatureStatus.MERGE_CONFLICT, "Merge failed")
+        state.save(state_file)
+
+        # 3. User decides conflicts are too hard, drops feature
+        state = FeatureState.load(state_file)
+        state.drop_reason = "Conflicts too complex to resolve"
+        state.transition_to(FeatureStatus.DROPPED, "Giving up")
+        state.save(state_file)
+
+        # Verify final state
+        final_state = FeatureState.load(state_file)
+        assert final_state.status == FeatureStatus.DROPPED
+        assert final_state.drop_reason == "Conflicts too complex to resolve"
+        assert final_state.merge_error == "error: too many conflicts"
+        # DRAFT → IN_PROGRESS → READY → MERGE_CONFLICT → DROPPED
+        assert len(final_state.transitions) == 5
@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 
 from weft.config.errors import ConfigError
-from weft.utils.project import find_project_root, get_project_root
+from weft.utils.project import clear_project_root_cache, find_project_root, get_project_root
 
 
 class TestFindProjectRoot:
@@ -20,52 +20,47 @@ class TestFindProjectRoot:
 
         assert result == tmp_path
 
-    def test_finds_weftrc_in_parent_directory(self, tmp_path: Path, monkeypatch):
+    def test_finds_weftrc_in_parent_directory(self, tmp_path: Path):
         """Test finding .weftrc.yaml in parent directory."""
         (tmp_path / ".weftrc.yaml").write_text("project:\n  name: test\n  type: backend\n")
         subdir = tmp_path / "src"
         subdir.mkdir()
 
-        monkeypatch.chdir(subdir)
-        result = find_project_root()
+        result = find_project_root(start_path=subdir)
 
         assert result == tmp_path
 
-    def test_finds_weftrc_in_nested_parent(self, tmp_path: Path, monkeypatch):
+    def test_finds_weftrc_in_nested_parent(self, tmp_path: Path):
         """Test finding .weftrc.yaml multiple levels up."""
         (tmp_path / ".weftrc.yaml").write_text("project:\n  name: test\n  type: backend\n")
         deep_dir = tmp_path / "src" / "deep" / "nested"
         deep_dir.mkdir(parents=True)
 
-        monkeypatch.chdir(deep_dir)
-        result = find_project_root()
+        result = find_project_root(start_path=deep_dir)
 
         assert result == tmp_path
 
-    def test_finds_weft_directory(self, tmp_path: Path, monkeypatch):
+    def test_finds_weft_directory(self, tmp_path: Path):
         """Test finding .weft/ directory as fallback."""
         weft_dir = tmp_path / ".weft"
         weft_dir.mkdir()
 
-        monkeypatch.chdir(tmp_path)
-        result = find_project_root()
+        result = find_project_root(start_path=tmp_path)
 
         assert result == tmp_path
 
-    def test_prefers_weftrc_over_weft_dir(self, tmp_path: Path, monkeypatch):
+    def test_prefers_weftrc_over_weft_dir(self, tmp_path: Path):
         """Test that .weftrc.yaml is preferred over .weft/ directory."""
         (tmp_path / ".weftrc.yaml").write_text("project:\n  name: test\n  type: backend\n")
         (tmp_path / ".weft").mkdir()
 
-        monkeypatch.chdir(tmp_path)
-        result = find_project_root()
+        result = find_project_root(start_path=tmp_path)
 
         assert result == tmp_path
 
-    def test_returns_none_when_not_found(self, tmp_path: Path, monkeypatch):
+    def test_returns_none_when_not_found(self, tmp_path: Path):
         """Test returns None when no project root found."""
-        monkeypatch.chdir(tmp_path)
-        result = find_project_root()
+        result = find_project_root(start_path=tmp_path)
 
         assert result is None
 
@@ -79,7 +74,7 @@ class TestFindProjectRoot:
 
         assert result == tmp_path
 
-    def test_resolves_symlinks(self, tmp_path: Path, monkeypatch):
+    def test_resolves_symlinks(self, tmp_path: Path):
         """Test handles symlinks correctly."""
         project_root = tmp_path / "project"
         project_root.mkdir()
@@ -91,11 +86,45 @@ class TestFindProjectRoot:
         link = tmp_path / "link"
         link.symlink_to(subdir)
 
-        monkeypatch.chdir(link)
-        result = find_project_root()
+        result = find_project_root(start_path=link)
 
         assert result == project_root.resolve()
 
+    def test_caches_root_for_intermediate_directories(self, tmp_path: Path):
+        """Test a lookup caches the root for every directory it walked through."""
+        (tmp_path / ".weftrc.yaml").write_text("project:\n  name: test\n  type: backend\n")
+        deep_dir = tmp_path / "src" / "deep"
+        deep_dir.mkdir(parents=True)
+
+        assert find_project_root(start_path=deep_dir) == tmp_path
+        (tmp_path / ".weftrc.yaml").unlink()
+
+        assert find_project_root(start_path=tmp_path / "src") == tmp_path
+        clear_project_root_cache()
+        assert find_project_root(start_path=tmp_path / "src") is None
+
+    def test_relative_start_path_follows_working_directory(self, tmp_path: Path, monkeypatch):
+        """Test a relative start path is not served from another directory's cache entry."""
+        first = tmp_path / "p1"
+        second = tmp_path / "p2"
+        for project in (first, second):
+            project.mkdir()
+            (project / ".weftrc.yaml").write_text("project:\n  name: test\n")
+
+        monkeypatch.chdir(first)
+        assert find_project_root(Path(".")) == first
+
+        monkeypatch.chdir(second)
+        assert find_project_root(Path(".")) == second
+
+    def test_does_not_cache_missing_root(self, tmp_path: Path):
+        """Test a project created after a failed lookup is found."""
+        assert find_project_root(start_path=tmp_path) is None
+
+        (tmp_path / ".weft").mkdir()
+
+        assert find_project_root(start_path=tmp_path) == tmp_path
+
 
 class TestGetProjectRoot:
     """Tests for get_project_root function."""
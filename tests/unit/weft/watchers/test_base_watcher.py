@@ -12,6 +12,13 @@ from weft.queue.models import PromptTask
 from weft.watchers.base import BaseWatcher
 
 
+def wait_until_queue_drained(agent_dir: Path, timeout: float = 5.0) -> None:
+    """Wait until every prompt in agent_dir/in has been marked processed."""
+    deadline = time.monotonic() + timeout
+    while list((agent_dir / "in").glob("*.md")) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
 class TestWatcher(BaseWatcher):
     """Test implementation of BaseWatcher for testing."""
 
@@ -137,6 +144,19 @@ class TestStartStop:
         # Thread should complete
         assert not thread.is_alive()
 
+    def test_stop_interrupts_poll_wait(self, temp_dir: Path) -> None:
+        """Test that stop() ends the wait between polls without a full interval."""
+        watcher = TestWatcher("feat/test", "01-architect", temp_dir, poll_interval=60)
+
+        thread = threading.Thread(target=watcher.start, daemon=True)
+        thread.start()
+
+        time.sleep(0.1)
+        watcher.stop()
+        thread.join(timeout=2)
+
+        assert not thread.is_alive()
+
 
 class TestPromptProcessing:
     """Tests for prompt processing."""
@@ -161,8 +181,7 @@ class TestPromptProcessing:
         thread = threading.Thread(target=run_watcher, daemon=True)
         thread.start()
 
-        # Wait for processing
-        time.sleep(2)
+        wait_until_queue_drained(agent_dir)
         watcher.stop()
         thread.join(timeout=2)
 
@@ -198,7 +217,6 @@ class TestPromptProcessing:
 
         for prompt in prompts:
             write_prompt(temp_dir, "feat/test", "01-architect", prompt)
-            time.sleep(0.01)  # Ensure different timestamps
 
         # Process prompts
         watcher = TestWatcher("feat/test", "01-architect", temp_dir, poll_interval=1)
@@ -209,8 +227,7 @@ class TestPromptProcessing:
         thread = threading.Thread(target=run_watcher, daemon=True)
         thread.start()
 
-        # Wait for all to process
-        time.sleep(3)
+        wait_until_queue_drained(agent_dir)
         watcher.stop()
         thread.join(timeout=2)
 
@@ -235,7 +252,6 @@ class TestPromptProcessing:
         for i in range(3):
             prompt = PromptTask("feat/test", "01-architect", f"Prompt {i}")
             write_prompt(temp_dir, "feat/test", "01-architect", prompt)
-            time.sleep(0.01)
 
         watcher = TestWatcher("feat/test", "01-architect", temp_dir, poll_interval=1)
 
@@ -245,7 +261,7 @@ class TestPromptProcessing:
         thread = threading.Thread(target=run_watcher, daemon=True)
         thread.start()
 
-        time.sleep(3)
+        wait_until_queue_drained(agent_dir)
         watcher.stop()
         thread.join(timeout=2)
 
@@ -268,7 +284,7 @@ class TestPromptProcessing:
         thread = threading.Thread(target=run_watcher, daemon=True)
         thread.start()
 
-        time.sleep(2)
+        time.sleep(0.2)
         watcher.stop()
         thread.join(timeout=2)
 
@@ -298,7 +314,7 @@ class TestErrorHandling:
         thread = threading.Thread(target=run_watcher, daemon=True)
         thread.start()
 
-        time.sleep(2)
+        wait_until_queue_drained(agent_dir)
         watcher.stop()
         thread.join(timeout=2)
 
@@ -323,7 +339,6 @@ class TestErrorHandling:
         for i in range(3):
             prompt = PromptTask("feat/test", "01-architect", f"Prompt {i}")
             write_prompt(temp_dir, "feat/test", "01-architect", prompt)
-            time.sleep(0.01)
 
         # Use error watcher
         watcher = ErrorWatcher("feat/test", "01-architect", temp_dir, poll_interval=1)
@@ -334,7 +349,7 @@ class TestErrorHandling:
         thread = threading.Thread(target=run_watcher, daemon=True)
         thread.start()
 
-        time.sleep(3)
+        wait_until_queue_drained(agent_dir)
         watcher.stop()
         thread.join(timeout=2)
 
@@ -352,7 +367,7 @@ class TestSignalHandling:
 
     def test_signal_handler_stops_watcher(self, temp_dir: Path) -> None:
         """Test that signal handler stops the watcher."""
-        watcher = TestWatcher("feat/test", "01-architect", temp_dir)
+        watcher = TestWatcher("feat/test", "01-architect", temp_dir, poll_interval=1)
 
         def run_watcher():
             watcher.start()
@@ -370,6 +385,31 @@ class TestSignalHandling:
         assert not watcher.is_running
         assert not thread.is_alive()
 
+    def test_init_leaves_signal_handlers_alone(self, temp_dir: Path) -> None:
+        """Test that constructing a watcher does not take over SIGINT/SIGTERM."""
+        sigint, sigterm = signal.getsignal(signal.SIGINT), signal.getsignal(signal.SIGTERM)
+
+        TestWatcher("feat/test", "01-architect", temp_dir)
+
+        assert signal.getsignal(signal.SIGINT) is sigint
+        assert signal.getsignal(signal.SIGTERM) is sigterm
+
+    def test_start_installs_and_restores_handlers(self, temp_dir: Path) -> None:
+        """Test that handlers are installed while the loop runs and restored after."""
+        watcher = TestWatcher("feat/test", "01-architect", temp_dir, poll_interval=60)
+        original = signal.getsignal(signal.SIGINT)
+        seen = []
+
+        def stop_later():
+            seen.append(signal.getsignal(signal.SIGINT))
+            watcher.stop()
+
+        threading.Timer(0.1, stop_later).start()
+        watcher.start()
+
+        assert seen == [watcher._signal_handler]
+        assert signal.getsignal(signal.SIGINT) is original
+
 
 @pytest.mark.timeout(30)
 class TestIntegration:
@@ -401,8 +441,7 @@ class TestIntegration:
         thread = threading.Thread(target=run_watcher, daemon=True)
         thread.start()
 
-        # Wait for processing
-        time.sleep(2)
+        wait_until_queue_drained(agent_dir)
         watcher.stop()
         thread.join(timeout=2)
 
@@ -449,7 +488,6 @@ class TestIntegration:
 
         for prompt in prompts:
             write_prompt(temp_dir, "feat/mixed", "01-architect", prompt)
-            time.sleep(0.01)
 
         watcher = MixedWatcher("feat/mixed", "01-architect", temp_dir, poll_interval=1)
 
@@ -459,7 +497,7 @@ class TestIntegration:
         thread = threading.Thread(target=run_watcher, daemon=True)
         thread.start()
 
-        time.sleep(3)
+        wait_until_queue_drained(agent_dir)
         watcher.stop()
         thread.join(timeout=2)
 
@@ -8,46 +8,54 @@ import re
 import shutil
 import subprocess
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
 from pathlib import Path
 
 
-class Status(Enum):
+class Status(StrEnum):
     PASS = "pass"
     FAIL = "fail"
     WARN = "warn"
     SKIP = "skip"
 
 
-@dataclass
+@dataclass(slots=True)
 class Check:
     name: str
     status: Status
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionResult:
     name: str
     checks: list[Check] = field(default_factory=list)
 
     @property
     def passed(self) -> bool:
-        return all(c.status in [Status.PASS, Status.SKIP, Status.WARN] for c in self.checks)
+        # Every status other than FAIL passes; enum members compare by identity
+        return not any(c.status is Status.FAIL for c in self.checks)
 
 
-def redact_secrets(text: str) -> str:
-    patterns = [
+_REDACT_PATTERNS = [
+    (re.compile(pattern), replacement)
+    for pattern, replacement in [
         (r"(sk-ant-[a-zA-Z0-9-]+)", "REDACTED"),
         (r"(WEFT_[A-Z_]*KEY[A-Z_]*=)([^\s]+)", r"\1REDACTED"),
         (r"(export\s+WEFT_[A-Z_]*=)([^\s]+)", r"\1REDACTED"),
         (r'(api_key\s*=\s*["\'])([^"\']+)(["\'])', r"\1REDACTED\3"),
         (r"(Bearer\s+)([^\s]+)", r"\1REDACTED"),
     ]
+]
+
 
-    for pattern, replacement in patterns:
-        text = re.sub(pattern, replacement, text)
+def redact_secrets(text: str) -> str:
+    # Applied in order: later patterns may see earlier redactions, so they stay separate passes
+    for pattern, replacement in _REDACT_PATTERNS:
+        text = pattern.sub(replacement, text)
 
     return text
 
@@ -56,11 +64,14 @@ def tail_output(text: str, lines: int = 10) -> str:
     if not text:
         return ""
 
-    text_lines = text.split("\n")
-    if len(text_lines) <= lines:
-        return text
+    # Walk back over the last newlines and slice once instead of splitting every line
+    start = len(text)
+    for _ in range(lines):
+        start = text.rfind("\n", 0, start)
+        if start == -1:
+            return text
 
-    return "\n".join(text_lines[-lines:])
+    return text[start + 1 :]
 
 
 class WeftValidator:
@@ -109,37 +120,40 @@ class WeftValidator:
     def validate_repository(self) -> SectionResult:
         result = SectionResult(name="B) Repository")
 
-        # Check if git repo
-        try:
-            subprocess.run(
-                ["git", "rev-parse", "--git-dir"], check=True, capture_output=True, timeout=10
-            )
-            result.checks.append(Check("Git Repository", Status.PASS, "Valid git repository"))
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            result.checks.append(Check("Git Repository", Status.FAIL, "Not a git repository"))
-            return result
-
-        # Check working tree status
+        # One git call answers both checks: status fails outside a repository
         try:
             status_result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                check=True,
+                # Only emptiness matters, so stdout stays raw bytes and is never decoded
+                ["git", "status", "--porcelain", "-z"],
                 capture_output=True,
-                text=True,
                 timeout=10,
             )
+        except FileNotFoundError:
+            result.checks.append(Check("Git Repository", Status.FAIL, "Not a git repository"))
+            return result
 
-            if status_result.stdout.strip():
-                if self.args.allow_dirty:
-                    result.checks.append(
-                        Check("Working Tree", Status.WARN, "Uncommitted changes (allowed)")
-                    )
-                else:
-                    result.checks.append(Check("Working Tree", Status.FAIL, "Uncommitted changes"))
+        if status_result.returncode != 0:
+            stderr = status_result.stderr.decode(errors="replace").strip()
+            # git's message is localized, so fall back to its own first line
+            if not stderr or "not a git repository" in stderr.lower():
+                message = "Not a git repository"
+            else:
+                message = f"Could not check status: {stderr.splitlines()[0]}"
+            result.checks.append(Check("Git Repository", Status.FAIL, message))
+            return result
+
+        result.checks.append(Check("Git Repository", Status.PASS, "Valid git repository"))
+
+        # Check working tree status
+        if status_result.stdout.strip():
+            if self.args.allow_dirty:
+                result.checks.append(
+                    Check("Working Tree", Status.WARN, "Uncommitted changes (allowed)")
+                )
             else:
-                result.checks.append(Check("Working Tree", Status.PASS, "Clean"))
-        except subprocess.CalledProcessError:
-            result.checks.append(Check("Working Tree", Status.FAIL, "Could not check status"))
+                result.checks.append(Check("Working Tree", Status.FAIL, "Uncommitted changes"))
+        else:
+            result.checks.append(Check("Working Tree", Status.PASS, "Clean"))
 
         return result
 
@@ -173,8 +187,10 @@ class WeftValidator:
             try:
                 import yaml
 
-                with open(weftrc_path) as f:
-                    yaml.safe_load(f)
+                # libyaml's C loader when PyYAML was built with it; same safe subset
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                with open(weftrc_path, "rb") as f:
+                    yaml.load(f, Loader=loader)
                 result.checks.append(Check(".weftrc.yaml", Status.PASS, "Valid YAML"))
             except ImportError:
                 result.checks.append(
@@ -206,17 +222,17 @@ class WeftValidator:
 
         return result
 
-    def run(self) -> dict:
-        sections = []
+    # Section letters map to the plain functions, so dispatch needs no getattr by name
+    _VALIDATORS = {
+        "A": validate_environment,
+        "B": validate_repository,
+        "C": validate_commands,
+        "D": validate_contracts,
+        "E": validate_tests,
+    }
 
-        # Map section letters to validators
-        validators = {
-            "A": ("validate_environment", "A) Environment"),
-            "B": ("validate_repository", "B) Repository"),
-            "C": ("validate_commands", "C) Commands"),
-            "D": ("validate_contracts", "D) Contracts"),
-            "E": ("validate_tests", "E) Tests"),
-        }
+    def compute_sections(self) -> list[SectionResult]:
+        validators = self._VALIDATORS
 
         # If specific section requested, run only that one
         if self.args.section:
@@ -226,50 +242,61 @@ class WeftValidator:
                 print(f"Valid sections: {', '.join(validators.keys())}", file=sys.stderr)
                 sys.exit(2)
 
-            method_name, _ = validators[section_letter]
-            method = getattr(self, method_name)
-            sections.append(method())
-        else:
-            # Run all sections
-            for method_name, _ in validators.values():
-                method = getattr(self, method_name)
-                sections.append(method())
-
-        # Calculate summary
-        total_checks = sum(len(s.checks) for s in sections)
-        passed_checks = sum(len([c for c in s.checks if c.status == Status.PASS]) for s in sections)
-        failed_checks = sum(len([c for c in s.checks if c.status == Status.FAIL]) for s in sections)
-        warned_checks = sum(len([c for c in s.checks if c.status == Status.WARN]) for s in sections)
-        skipped_checks = sum(
-            len([c for c in s.checks if c.status == Status.SKIP]) for s in sections
-        )
-
-        summary = {
-            "total": total_checks,
-            "passed": passed_checks,
-            "failed": failed_checks,
-            "warned": warned_checks,
-            "skipped": skipped_checks,
-        }
-
-        return {
-            "sections": [
-                {
-                    "name": s.name,
-                    "passed": s.passed,
-                    "checks": [
-                        {
-                            "name": c.name,
-                            "status": c.status.value,
-                            "message": redact_secrets(c.message),
-                        }
-                        for c in s.checks
-                    ],
-                }
-                for s in sections
-            ],
-            "summary": summary,
-        }
+            return [validators[section_letter](self)]
+
+        # Fail-fast gives up the overlap to skip the sections after the first failure
+        if self.args.fail_fast:
+            sections = []
+            for validate in validators.values():
+                section = validate(self)
+                sections.append(section)
+                if not section.passed:
+                    break
+            return sections
+
+        # Sections are independent, so the git call and PATH lookups overlap; map keeps order
+        with ThreadPoolExecutor(max_workers=len(validators)) as pool:
+            return list(pool.map(lambda validate: validate(self), validators.values()))
+
+    def run(self) -> dict:
+        return to_dict(self.compute_sections())
+
+
+def summarize(sections: list[SectionResult]) -> dict:
+    # Calculate summary in one pass over all checks
+    counts = Counter(c.status for s in sections for c in s.checks)
+
+    return {
+        "total": sum(counts.values()),
+        "passed": counts[Status.PASS],
+        "failed": counts[Status.FAIL],
+        "warned": counts[Status.WARN],
+        "skipped": counts[Status.SKIP],
+    }
+
+
+def to_dict(sections: list[SectionResult]) -> dict:
+    return {
+        "sections": [
+            {
+                "name": s.name,
+                "passed": s.passed,
+                "checks": [
+                    {
+                        "name": c.name,
+                        "status": c.status,
+                        "message": redact_secrets(c.message),
+                    }
+                    for c in s.checks
+                ],
+            }
+            for s in sections
+        ],
+        "summary": summarize(sections),
+    }
+
+
+_STATUS_SYMBOLS = {Status.PASS: "✓", Status.FAIL: "✗", Status.WARN: "⚠", Status.SKIP: "-"}
 
 
 def main():
@@ -279,36 +306,43 @@ def main():
     parser.add_argument("--section", help="Run specific section (A, B, C, D, E)")
     parser.add_argument("--allow-dirty", action="store_true", help="Allow uncommitted changes")
     parser.add_argument("--no-tests", action="store_true", help="Skip test execution")
+    parser.add_argument(
+        "--fail-fast", action="store_true", help="Stop after the first section that fails"
+    )
 
     args = parser.parse_args()
 
     validator = WeftValidator(args)
-    result = validator.run()
+    sections = validator.compute_sections()
 
     if args.json:
+        result = to_dict(sections)
+        summary = result["summary"]
         print(json.dumps(result, indent=2))
     else:
-        # Pretty print
-        for section in result["sections"]:
-            print(f"\n{section['name']}")
-            print("=" * 60)
-            for check in section["checks"]:
-                status_symbol = {"pass": "✓", "fail": "✗", "warn": "⚠", "skip": "-"}[
-                    check["status"]
-                ]
-                print(f"  {status_symbol} {check['name']}: {check['message']}")
-
-        print("\n" + "=" * 60)
-        print("VALIDATION SUMMARY")
-        print("=" * 60)
-        print(f"Total:   {result['summary']['total']}")
-        print(f"Passed:  {result['summary']['passed']}")
-        print(f"Failed:  {result['summary']['failed']}")
-        print(f"Warned:  {result['summary']['warned']}")
-        print(f"Skipped: {result['summary']['skipped']}")
+        # Pretty print straight from the checks, joined into a single write
+        summary = summarize(sections)
+        rule = "=" * 60
+        out = []
+        for section in sections:
+            out.append(f"\n{section.name}")
+            out.append(rule)
+            for check in section.checks:
+                status_symbol = _STATUS_SYMBOLS[check.status]
+                out.append(f"  {status_symbol} {check.name}: {redact_secrets(check.message)}")
+
+        out.append("\n" + rule)
+        out.append("VALIDATION SUMMARY")
+        out.append(rule)
+        out.append(f"Total:   {summary['total']}")
+        out.append(f"Passed:  {summary['passed']}")
+        out.append(f"Failed:  {summary['failed']}")
+        out.append(f"Warned:  {summary['warned']}")
+        out.append(f"Skipped: {summary['skipped']}")
+        sys.stdout.write("\n".join(out) + "\n")
 
     # Exit code: 0 if all passed, 1 if any failed
-    sys.exit(1 if result["summary"]["failed"] > 0 else 0)
+    sys.exit(1 if summary["failed"] > 0 else 0)
 
 
 if __name__ == "__main__":